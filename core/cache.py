@@ -1,9 +1,12 @@
+import json
 import logging
 from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 from django.conf import settings
 from lxml import etree
 import mistune
+from feed2json import feed2json
 from feedgen.feed import FeedGenerator
 from core.models import Feed, Entry, Tag
 from utils.text_handler import set_translation_display
@@ -12,40 +15,102 @@ from .models import Feed
 
 logger = logging.getLogger(__name__)
 
+# 缓存键模板：绑定的 format 方法只创建一次，视图和缓存写入共用
+# v2：json 键改存序列化好的 JSON Feed，旧版键下的 Atom 内容不再被读取
+rss_cache_key = "cache_rss_v2_{}_{}_{}".format
+tag_cache_key = "cache_tag_v2_{}_{}_{}".format
+digest_cache_key = "cache_digest_v2_{}_{}".format
+
+
+def _render(atom_feed: str, format="xml") -> str:
+    """缓存内容：xml 保存 Atom 原文，json 保存序列化好的 JSON Feed"""
+    if format == "json":
+        return json.dumps(feed2json(atom_feed), cls=DjangoJSONEncoder)
+    return atom_feed
+
+
+def _translation_ready(feed: Feed, feed_type: str) -> bool:
+    """
+    判断该 feed_type 是否可以（重新）生成缓存。
+
+    翻译进行中返回 False，调用方保留旧缓存；翻译失败记录警告后仍返回 True，
+    用原文生成 feed。
+    """
+    if feed_type != "t" or not (
+        feed.translate_title or feed.translate_content or feed.summary
+    ):
+        return True
+    if feed.translation_status is None:
+        logger.debug(f"Translation in progress for {feed.slug}, keeping old cache")
+        return False
+    if feed.translation_status is False:
+        logger.warning(
+            f"Translation failed for {feed.slug}, generating feed with original content"
+        )
+    return True
+
 
 def cache_rss(feed_slug: str, feed_type="t", format="xml"):
     logger.debug(
         f"Start cache_rss for {feed_slug} with type {feed_type} and format {format}"
     )
     # 生成唯一的缓存键
-    cache_key = f"cache_rss_{feed_slug}_{feed_type}_{format}"
+    cache_key = rss_cache_key(feed_slug, feed_type, format)
 
     feed = Feed.objects.get(slug=feed_slug)
-    # 如果请求翻译版本，检查翻译状态  
-    if feed_type == "t" and (feed.translate_title or feed.translate_content or feed.summary):  
-        if feed.translation_status is None:  
-            # 翻译正在进行中，不更新缓存  
-            logger.debug(f"Translation in progress for {feed_slug}, using old cache if available")  
-            existing_cache = cache.get(cache_key)  
-            return existing_cache  # 返回旧缓存或 None  
-        elif feed.translation_status is False:  
-            # 翻译失败，记录警告但仍然生成 feed（包含原文）  
-            logger.warning(f"Translation failed for {feed_slug}, generating feed with original content")
-              
+    if not _translation_ready(feed, feed_type):
+        return cache.get(cache_key)  # 返回旧缓存或 None
+
     atom_feed = generate_atom_feed(feed, feed_type)
     if not atom_feed:
         return None
+    content = _render(atom_feed, format)
 
     # 缓存
-    cache.set(cache_key, atom_feed, feed.update_frequency or 86400)  # default to 1 day
+    cache.set(cache_key, content, feed.update_frequency or 86400)  # default to 1 day
     logger.debug(f"Cached successfully with key {cache_key}")
-    return atom_feed
+    return content
+
+
+def cache_rss_bulk(feed_slug: str, variants) -> dict:
+    """
+    一次性缓存同一个Feed的多个 (feed_type, format) 变体。
+
+    Feed只查询一次，每种feed_type只生成一次Atom（xml/json共用同一份内容），
+    最后通过 cache.set_many 一次写入。返回 {cache_key: 缓存内容}，
+    xml 变体为 Atom 原文，json 变体为序列化好的 JSON Feed 字符串。
+    """
+    logger.debug(f"Start cache_rss_bulk for {feed_slug} with variants {variants}")
+    feed = Feed.objects.get(slug=feed_slug)
+
+    generated = {}
+    to_cache = {}
+    for feed_type, format in variants:
+        cache_key = rss_cache_key(feed_slug, feed_type, format)
+        if feed_type not in generated:
+            # 每种feed_type只判断一次翻译状态；未就绪时记为 None，保留旧缓存
+            generated[feed_type] = (
+                generate_atom_feed(feed, feed_type)
+                if _translation_ready(feed, feed_type)
+                else None
+            )
+        if generated[feed_type]:
+            try:
+                to_cache[cache_key] = _render(generated[feed_type], format)
+            except Exception as e:
+                # 单个格式转换失败不影响其他变体
+                logger.warning(f"Failed to render {cache_key}: {str(e)}")
+
+    if to_cache:
+        cache.set_many(to_cache, feed.update_frequency or 86400)  # default to 1 day
+        logger.debug(f"Cached successfully with keys {list(to_cache)}")
+    return to_cache
 
 
 def cache_tag(tag: str, feed_type="t", format="xml"):
     logger.debug(f"Start cache_tag for {tag} with type {feed_type} and format {format}")
     # 生成唯一的缓存键
-    cache_key = f"cache_tag_{tag}_{feed_type}_{format}"
+    cache_key = tag_cache_key(tag, feed_type, format)
 
     feeds = Feed.objects.filter(tags__name=tag)
     max_frequency_feed = feeds.order_by("-update_frequency").first()
@@ -53,17 +118,18 @@ def cache_tag(tag: str, feed_type="t", format="xml"):
 
     if not atom_feed:
         return None
+    content = _render(atom_feed, format)
 
     # 缓存
     max_frequency = max_frequency_feed.update_frequency if max_frequency_feed else 86400
-    cache.set(cache_key, atom_feed, max_frequency)
+    cache.set(cache_key, content, max_frequency)
     logger.debug(f"Cached successfully with key {cache_key}")
-    return atom_feed
+    return content
 
 
 def cache_digest(slug: str, format: str = "xml"):
     logger.debug(f"Start cache_digest for {slug} with format {format}")
-    cache_key = f"cache_digest_{slug}_{format}"
+    cache_key = digest_cache_key(slug, format)
 
     from .models import Digest
 
@@ -73,11 +139,12 @@ def cache_digest(slug: str, format: str = "xml"):
     atom_feed = generate_atom_feed(digest_feed, "t")
     if not atom_feed:
         return None
+    content = _render(atom_feed, format)
 
     ttl = digest_feed.update_frequency or 86400
-    cache.set(cache_key, atom_feed, ttl)
+    cache.set(cache_key, content, ttl)
     logger.debug(f"Cached successfully with key {cache_key}")
-    return atom_feed
+    return content
 
 
 def _build_atom_feed(
@@ -1,6 +1,5 @@
 import logging
 import sys
-from itertools import chain
 import time
 import os
 from concurrent.futures import wait
@@ -12,12 +11,25 @@ from core.tasks.translate_feeds import handle_feeds_translation
 from core.tasks.summarize_feeds import handle_feeds_summary
 from django.db import close_old_connections
 from core.tasks.task_manager import task_manager
-from core.cache import cache_rss, cache_tag
+from core.cache import cache_rss_bulk, cache_tag
 
 current_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time()))
 
 logger = logging.getLogger(__name__)
 
+# Simple update frequency -> Feed.update_frequency (minutes)
+_FREQ_MINUTES = {
+    "5 min": 5,
+    "15 min": 15,
+    "30 min": 30,
+    "hourly": 60,
+    "daily": 1440,
+    "weekly": 10080,
+}
+# (feed_type, format) variants cached after each update
+_RSS_CACHE_VARIANTS = (("o", "xml"), ("o", "json"), ("t", "xml"), ("t", "json"))
+_TAG_CACHE_VARIANTS = (("o", "xml"), ("t", "xml"), ("t", "json"))
+
 
 class Command(BaseCommand):
     help = "Updates feeds based on specified frequency or runs immediate update"
@@ -36,17 +48,9 @@ class Command(BaseCommand):
             self.stderr.write(f"{current_time}: Error: Frequency must be specified.")
             sys.exit(1)
 
-        valid_frequencies = [
-            "5 min",
-            "15 min",
-            "30 min",
-            "hourly",
-            "daily",
-            "weekly",
-        ]
-        if target_frequency not in valid_frequencies:
+        if target_frequency not in _FREQ_MINUTES:
             self.stderr.write(
-                f"{current_time}: Error: Invalid frequency. Valid options: {', '.join(valid_frequencies)}"
+                f"{current_time}: Error: Invalid frequency. Valid options: {', '.join(_FREQ_MINUTES)}"
             )
             sys.exit(1)
 
@@ -143,33 +147,26 @@ def update_multiple_feeds(feeds: list):
             except Exception as e:
                 logger.warning(f"A feed update task resulted in an exception: {e}")
 
-        # 所有任务完成后执行缓存操作
+        # 所有任务完成后在当前线程执行缓存操作：本函数可能已运行在 task_manager
+        # 的工作线程中（如后台"强制更新"），再向同一线程池提交并等待会与其重启互相阻塞
         # Note: 'feeds' is a list materialized from an iterator, so it's safe to iterate again.
+        # 每个feed一次调用，xml/json变体共用一次生成
         for feed in feeds:
             try:
-                cache_rss(feed.slug, feed_type="o", format="xml")
-                cache_rss(feed.slug, feed_type="o", format="json")
-                cache_rss(feed.slug, feed_type="t", format="xml")
-                cache_rss(feed.slug, feed_type="t", format="json")
+                cache_rss_bulk(feed.slug, _RSS_CACHE_VARIANTS)
             except Exception as e:
                 logger.error(
                     f"{time.time()}: Failed to cache RSS for {feed.slug}: {str(e)}"
                 )
 
-        # 获取所有 feeds 关联的 tags（去重）
-        tag_ids = set(
-            chain.from_iterable(
-                feed.tags.values_list("id", flat=True) for feed in feeds
-            )
-        )
-        tags = Tag.objects.filter(id__in=tag_ids)
+        # 一次查询获取所有 feeds 关联的 tags（去重）
+        tags = Tag.objects.filter(feeds__in=feeds).distinct().only("slug")
         for tag in tags:
-            try:
-                cache_tag(tag.slug, feed_type="o", format="xml")
-                cache_tag(tag.slug, feed_type="t", format="xml")
-                cache_tag(tag.slug, feed_type="t", format="json")
-            except Exception as e:
-                logger.error(f"Failed to cache tag {tag.slug}: {str(e)}")
+            for feed_type, format in _TAG_CACHE_VARIANTS:
+                try:
+                    cache_tag(tag.slug, feed_type=feed_type, format=format)
+                except Exception as e:
+                    logger.error(f"Failed to cache tag {tag.slug}: {str(e)}")
 
     except Exception as e:
         logger.exception("Command update_multiple_feeds failed: %s", str(e))
@@ -179,17 +176,12 @@ def update_feeds_for_frequency(simple_update_frequency: str):
     """
     Update feeds for given update frequency group.
     """
-    update_frequency_map = {
-        "5 min": 5,
-        "15 min": 15,
-        "30 min": 30,
-        "hourly": 60,
-        "daily": 1440,
-        "weekly": 10080,
-    }
+    frequency_val = _FREQ_MINUTES.get(simple_update_frequency)
+    if frequency_val is None:
+        logger.error(f"Invalid frequency: {simple_update_frequency}")
+        return
 
     try:
-        frequency_val = update_frequency_map[simple_update_frequency]
         # Use iterator to reduce initial memory load, then convert to list for multiple uses.
         feeds_iterator = Feed.objects.filter(update_frequency=frequency_val).iterator()
         feeds_list = list(feeds_iterator)
@@ -201,12 +193,11 @@ def update_feeds_for_frequency(simple_update_frequency: str):
 
         update_multiple_feeds(feeds_list)
 
-    except KeyError:
-        logger.error(f"Invalid frequency: {simple_update_frequency}")
-    except Exception as e:
-        log = f"{current_time}: Command update_feeds_for_frequency {simple_update_frequency}: {str(e)}"
-        logger.exception(log)
-        # print(log)
+    except Exception:
+        # logger.exception appends the traceback, including the error message
+        logger.exception(
+            "Command update_feeds_for_frequency %s failed", simple_update_frequency
+        )
 
 
 # if __name__ == "__main__":
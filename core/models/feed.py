@@ -202,7 +202,8 @@ class Feed(models.Model):
             )
         ]
 
-    def save(self, *args, **kwargs):
+    def prepare_for_save(self):
+        """Derive the fields `save()` fills in; also used before bulk_create."""
         if not self.slug:
             self.slug = uuid.uuid5(
                 uuid.NAMESPACE_URL,
@@ -224,6 +225,8 @@ class Feed(models.Model):
         if not self.summarizer_id:
             self.summarizer_id = None
 
+    def save(self, *args, **kwargs):
+        self.prepare_for_save()
         super(Feed, self).save(*args, **kwargs)
 
     def get_translation_display(self):
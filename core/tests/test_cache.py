@@ -3,17 +3,20 @@ from django.core.cache import cache
 from unittest.mock import patch
 
 from ..models import Feed, Tag
-from ..cache import cache_rss, cache_tag
+from ..cache import cache_rss, cache_rss_bulk, cache_tag
 
 
 class CacheRssTest(TestCase):
-    def setUp(self):
-        self.feed = Feed.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.feed = Feed.objects.create(
             name="Test Feed",
             feed_url="https://example.com/rss.xml",
             slug="test-feed-slug",
             update_frequency=3600,
         )
+
+    def setUp(self):
         cache.clear()
 
     def tearDown(self):
@@ -32,7 +35,7 @@ class CacheRssTest(TestCase):
         mock_generate_atom_feed.assert_called_with(self.feed, "t")
 
         # 验证缓存被设置
-        cache_key = "cache_rss_test-feed-slug_t_xml"
+        cache_key = "cache_rss_v2_test-feed-slug_t_xml"
         self.assertEqual(cache.get(cache_key), mock_atom_content)
 
         # 测试返回None的情况
@@ -63,40 +66,80 @@ class CacheRssTest(TestCase):
 
         self.assertEqual(result, mock_atom_content)
         # Feed模型会将0调整为5
-        cache_key = "cache_rss_test-feed-zero-freq_t_xml"
+        cache_key = "cache_rss_v2_test-feed-zero-freq_t_xml"
         mock_cache.set.assert_called_once_with(cache_key, mock_atom_content, 5)
 
+    @patch("core.cache.feed2json")
     @patch("core.cache.generate_atom_feed")
-    def test_cache_rss_different_parameters(self, mock_generate_atom_feed):
-        """测试不同参数生成不同缓存键"""
+    def test_cache_rss_different_parameters(
+        self, mock_generate_atom_feed, mock_feed2json
+    ):
+        """测试不同参数生成不同缓存键，json 变体缓存序列化后的 JSON"""
         mock_atom_content = "<feed>test content</feed>"
         mock_generate_atom_feed.return_value = mock_atom_content
+        mock_feed2json.return_value = {"title": "test"}
 
-        cache_rss("test-feed-slug", "o", "json")
+        result = cache_rss("test-feed-slug", "o", "json")
 
-        cache_key = "cache_rss_test-feed-slug_o_json"
-        self.assertEqual(cache.get(cache_key), mock_atom_content)
+        mock_feed2json.assert_called_once_with(mock_atom_content)
+        cache_key = "cache_rss_v2_test-feed-slug_o_json"
+        self.assertEqual(result, '{"title": "test"}')
+        self.assertEqual(cache.get(cache_key), '{"title": "test"}')
+
+    @patch("core.cache.feed2json", lambda atom: {"atom": atom})
+    @patch("core.cache.generate_atom_feed")
+    def test_cache_rss_bulk_generates_once_per_type(self, mock_generate_atom_feed):
+        """测试cache_rss_bulk每种feed_type只生成一次并写入所有变体"""
+        mock_generate_atom_feed.side_effect = lambda feed, feed_type: f"<feed>{feed_type}</feed>"
+        variants = (("o", "xml"), ("o", "json"), ("t", "xml"), ("t", "json"))
+
+        result = cache_rss_bulk("test-feed-slug", variants)
+
+        self.assertEqual(mock_generate_atom_feed.call_count, 2)
+        self.assertEqual(len(result), 4)
+        self.assertEqual(
+            cache.get("cache_rss_v2_test-feed-slug_o_json"), '{"atom": "<feed>o</feed>"}'
+        )
+        self.assertEqual(cache.get("cache_rss_v2_test-feed-slug_t_xml"), "<feed>t</feed>")
+
+    @patch("core.cache.generate_atom_feed")
+    def test_cache_rss_bulk_keeps_cache_while_translating(self, mock_generate_atom_feed):
+        """测试翻译进行中时保留翻译版本的旧缓存"""
+        self.feed.translate_title = True
+        self.feed.translation_status = None
+        self.feed.save()
+        cache.set("cache_rss_v2_test-feed-slug_t_xml", "old")
+        mock_generate_atom_feed.return_value = "<feed>new</feed>"
+
+        cache_rss_bulk("test-feed-slug", (("o", "xml"), ("t", "xml")))
+
+        mock_generate_atom_feed.assert_called_once_with(self.feed, "o")
+        self.assertEqual(cache.get("cache_rss_v2_test-feed-slug_t_xml"), "old")
+        self.assertEqual(cache.get("cache_rss_v2_test-feed-slug_o_xml"), "<feed>new</feed>")
 
 
 class CacheTagTest(TestCase):
-    def setUp(self):
-        self.tag = Tag.objects.create(name="test-tag")
+    @classmethod
+    def setUpTestData(cls):
+        cls.tag = Tag.objects.create(name="test-tag")
 
-        self.feed1 = Feed.objects.create(
+        cls.feed1 = Feed.objects.create(
             name="Test Feed 1",
             feed_url="https://example1.com/rss.xml",
             slug="test-feed-1",
             update_frequency=3600,
         )
-        self.feed2 = Feed.objects.create(
+        cls.feed2 = Feed.objects.create(
             name="Test Feed 2",
             feed_url="https://example2.com/rss.xml",
             slug="test-feed-2",
             update_frequency=7200,
         )
 
-        self.feed1.tags.add(self.tag)
-        self.feed2.tags.add(self.tag)
+        cls.feed1.tags.add(cls.tag)
+        cls.feed2.tags.add(cls.tag)
+
+    def setUp(self):
         cache.clear()
 
     def tearDown(self):
@@ -124,7 +167,7 @@ class CacheTagTest(TestCase):
         self.assertIn(self.feed2.id, feed_ids)
 
         # 验证缓存
-        cache_key = "cache_tag_test-tag_t_xml"
+        cache_key = "cache_tag_v2_test-tag_t_xml"
         self.assertEqual(cache.get(cache_key), mock_atom_content)
 
         # 测试返回None的情况
@@ -152,16 +195,17 @@ class CacheTagTest(TestCase):
         self.assertEqual(call_args[0][0], "nonexistent-tag")
         self.assertEqual(len(call_args[0][1]), 0)
 
-        cache_key = "cache_tag_nonexistent-tag_t_xml"
+        cache_key = "cache_tag_v2_nonexistent-tag_t_xml"
         self.assertEqual(cache.get(cache_key), mock_atom_content)
 
+    @patch("core.cache.feed2json", lambda atom: {"title": "content"})
     @patch("core.cache.merge_feeds_into_one_atom")
     def test_cache_tag_different_parameters(self, mock_merge_feeds):
-        """测试不同参数生成不同缓存键"""
+        """测试不同参数生成不同缓存键，json 变体缓存序列化后的 JSON"""
         mock_atom_content = "<feed>content</feed>"
         mock_merge_feeds.return_value = mock_atom_content
 
         cache_tag("test-tag", "o", "json")
 
-        cache_key = "cache_tag_test-tag_o_json"
-        self.assertEqual(cache.get(cache_key), mock_atom_content)
+        cache_key = "cache_tag_v2_test-tag_o_json"
+        self.assertEqual(cache.get(cache_key), '{"title": "content"}')
@@ -1,203 +1,183 @@
-from unittest.mock import patch, Mock, call, mock_open
+from unittest.mock import DEFAULT, patch, Mock, call
 from argparse import ArgumentParser
+from types import SimpleNamespace
 
+from django.core.exceptions import ObjectDoesNotExist as _DNE
 from django.test import SimpleTestCase
 
 from core.management.commands import feed_updater as cmd
 
 
+_FREQ_TO_LOCK = (
+    ("5 min", "/tmp/update_feeds_5_min.lock"),
+    ("15 min", "/tmp/update_feeds_15_min.lock"),
+    ("30 min", "/tmp/update_feeds_30_min.lock"),
+    ("hourly", "/tmp/update_feeds_hourly.lock"),
+    ("daily", "/tmp/update_feeds_daily.lock"),
+    ("weekly", "/tmp/update_feeds_weekly.lock"),
+)
+_VALID_FREQS = tuple(frequency for frequency, _ in _FREQ_TO_LOCK)
+
+
+def _seq(*values):
+    """Callable side_effect returning `values` one per call."""
+    it = iter(values)
+    return lambda *args, **kwargs: next(it)
+
+
+def _empty_iter():
+    """Fresh empty iterator, for `iterator.side_effect`."""
+    return iter(())
+
+
+def _wait_all(futures, timeout=None):
+    """`wait` stand-in that reports every future as done."""
+    return list(futures), []
+
+
+class _DummyFile:
+    """Minimal writable context manager standing in for the lock file."""
+
+    def __init__(self):
+        self.writes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def write(self, s):
+        self.writes.append(s)
+
+
 class UpdateFeedsHandleTests(SimpleTestCase):
     """Tests for `Command.handle` function covering edge cases."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One patcher covers the lock-file I/O: handle() reaches the file
+        # system only through the module's `os` and `open`.
+        cls.mock_open = Mock()
+        patcher = patch.multiple(cmd, os=DEFAULT, open=cls.mock_open, create=True)
+        cls.mock_os = patcher.start()["os"]
+        cls.addClassCleanup(patcher.stop)
+        cls.mock_exists = cls.mock_os.path.exists
+        cls.mock_remove = cls.mock_os.remove
+        cls.command = cmd.Command()
+        # The Command is owned by the class, so its streams need no patcher.
+        cls.command.stdout = Mock()
+        cls.command.stderr = Mock()
+        cls._fresh_command_dict = dict(cls.command.__dict__)
+
     def setUp(self):
         """Set up test data."""
-        self.command = cmd.Command()
-        self.valid_frequencies = [
-            "5 min",
-            "15 min",
-            "30 min",
-            "hourly",
-            "daily",
-            "weekly",
-        ]
-        self.frequency_to_lock = {
-            "5 min": "/tmp/update_feeds_5_min.lock",
-            "15 min": "/tmp/update_feeds_15_min.lock",
-            "30 min": "/tmp/update_feeds_30_min.lock",
-            "hourly": "/tmp/update_feeds_hourly.lock",
-            "daily": "/tmp/update_feeds_daily.lock",
-            "weekly": "/tmp/update_feeds_weekly.lock",
-        }
+        super().setUp()
+        patcher = patch.object(cmd, "update_feeds_for_frequency")
+        self.mock_update = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_os.reset_mock(return_value=True, side_effect=True)
+        self.lock_file = _DummyFile()
+        self.mock_open.reset_mock()
+        self.mock_open.return_value = self.lock_file
+        # Share one Command per class; undo any instance state a test leaves behind.
+        self.command.__dict__.update(self._fresh_command_dict)
+        self.command.stdout.reset_mock()
+        self.command.stderr.reset_mock()
+
+    def test_handle_frequency_parameter_matrix(self):
+        """Invalid or missing frequencies exit with 1; valid ones run the update."""
+        cases = [("2 hours", 1), (None, 1)] + [(f, None) for f in _VALID_FREQS]
+        self.mock_exists.return_value = False
+        for frequency, exit_code in cases:
+            with self.subTest(frequency=frequency):
+                self.mock_update.reset_mock()
+                if exit_code is None:
+                    self.command.handle(frequency=frequency)
+                    self.mock_update.assert_called_once_with(
+                        simple_update_frequency=frequency
+                    )
+                else:
+                    with self.assertRaises(SystemExit) as ctx:
+                        self.command.handle(frequency=frequency)
+                    self.assertEqual(ctx.exception.code, exit_code)
+                    self.mock_update.assert_not_called()
 
-    def test_handle_invalid_frequency(self):
-        """Invalid frequency string should raise SystemExit(1)."""
-        with patch.object(self.command, "stdout"), patch.object(self.command, "stderr"):
-            with self.assertRaises(SystemExit) as ctx:
-                self.command.handle(frequency="2 hours")
-            self.assertEqual(ctx.exception.code, 1)
-
-    def test_handle_no_frequency_provided(self):
-        """When no frequency is provided, should exit with code 1."""
-        with patch.object(self.command, "stdout"), patch.object(self.command, "stderr"):
-            with self.assertRaises(SystemExit) as ctx:
-                self.command.handle(frequency=None)
-            self.assertEqual(ctx.exception.code, 1)
-
-    @patch("core.management.commands.feed_updater.os.remove")
-    @patch("core.management.commands.feed_updater.open", new_callable=mock_open)
-    @patch("core.management.commands.feed_updater.os.path.exists", return_value=True)
-    def test_handle_lock_file_exists(self, mock_exists, mock_open_file, mock_remove):
+    def test_handle_lock_file_exists(self):
         """When lock file present, command should exit with code 0 and not proceed."""
-        with patch.object(self.command, "stdout"), patch.object(self.command, "stderr"):
-            with self.assertRaises(SystemExit) as ctx:
-                self.command.handle(frequency="5 min")
-            self.assertEqual(ctx.exception.code, 0)
-        mock_open_file.assert_not_called()
-        mock_remove.assert_not_called()
-
-    @patch("core.management.commands.feed_updater.os.remove")
-    @patch("core.management.commands.feed_updater.open", new_callable=mock_open)
-    @patch(
-        "core.management.commands.feed_updater.os.path.exists",
-        side_effect=[False, True],
-    )
-    @patch("core.management.commands.feed_updater.update_feeds_for_frequency")
-    def test_handle_happy_path(
-        self, mock_update, mock_exists, mock_open_file, mock_remove
-    ):
-        """Valid frequency without lock proceeds and cleans up lock file."""
-        # Mock stdout and stderr for the command instance
-        with patch.object(self.command, "stdout"), patch.object(self.command, "stderr"):
+        self.mock_exists.return_value = True
+        with self.assertRaises(SystemExit) as ctx:
             self.command.handle(frequency="5 min")
+        self.assertEqual(ctx.exception.code, 0)
+        self.mock_open.assert_not_called()
+        self.mock_update.assert_not_called()
+        self.mock_remove.assert_not_called()
 
-        mock_open_file.assert_called()
-        mock_update.assert_called_once_with(simple_update_frequency="5 min")
-        mock_remove.assert_called()
+    def test_handle_happy_path(self):
+        """Valid frequency without lock proceeds and cleans up lock file."""
+        self.mock_exists.side_effect = _seq(False, True)
+        self.command.handle(frequency="5 min")
 
-    def test_handle_all_valid_frequencies(self):
-        """Test that all valid frequencies are accepted."""
-        for frequency in self.valid_frequencies:
-            with self.subTest(frequency=frequency):
-                with (
-                    patch(
-                        "core.management.commands.feed_updater.os.path.exists",
-                        return_value=False,
-                    ),
-                    patch(
-                        "core.management.commands.feed_updater.open",
-                        new_callable=mock_open,
-                    ),
-                    patch("core.management.commands.feed_updater.os.remove"),
-                    patch(
-                        "core.management.commands.feed_updater.update_feeds_for_frequency"
-                    ) as mock_update,
-                ):
-                    # Mock stdout and stderr for the command instance
-                    with (
-                        patch.object(self.command, "stdout"),
-                        patch.object(self.command, "stderr"),
-                    ):
-                        self.command.handle(frequency=frequency)
-                    mock_update.assert_called_once_with(
-                        simple_update_frequency=frequency
-                    )
+        self.mock_open.assert_called()
+        self.mock_update.assert_called_once_with(simple_update_frequency="5 min")
+        self.mock_remove.assert_called()
 
-    @patch("core.management.commands.feed_updater.os.remove")
-    @patch("core.management.commands.feed_updater.open", new_callable=mock_open)
-    @patch(
-        "core.management.commands.feed_updater.os.path.exists",
-        side_effect=[False, True],
-    )
-    @patch("core.management.commands.feed_updater.update_feeds_for_frequency")
-    def test_handle_exception_during_update(
-        self, mock_update, mock_exists, mock_open_file, mock_remove
-    ):
+    def test_handle_exception_during_update(self):
         """Test exception handling during update_feeds_for_frequency."""
-        mock_update.side_effect = Exception("Update failed")
-
-        # Mock stdout and stderr for the command instance
-        with patch.object(self.command, "stdout"), patch.object(self.command, "stderr"):
-            with self.assertRaises(SystemExit) as ctx:
-                self.command.handle(frequency="5 min")
+        self.mock_exists.side_effect = _seq(False, True)
+        self.mock_update.side_effect = Exception("Update failed")
+        with (
+            patch.object(cmd.logger, "exception") as mock_exception,
+            self.assertRaises(SystemExit) as ctx,
+        ):
+            self.command.handle(frequency="5 min")
 
         self.assertEqual(ctx.exception.code, 1)
-        mock_remove.assert_called()
-
-    @patch("core.management.commands.feed_updater.os.remove")
-    @patch("core.management.commands.feed_updater.open", new_callable=mock_open)
-    @patch(
-        "core.management.commands.feed_updater.os.path.exists",
-        side_effect=[False, True],
-    )
-    @patch("core.management.commands.feed_updater.update_feeds_for_frequency")
-    @patch("core.management.commands.feed_updater.logger")
-    def test_handle_exception_logging(
-        self, mock_logger, mock_update, mock_exists, mock_open_file, mock_remove
-    ):
-        """Test that exceptions are properly logged."""
-        mock_update.side_effect = Exception("Update failed")
+        mock_exception.assert_called_once()
+        self.mock_remove.assert_called()
 
-        # Mock stdout and stderr for the command instance
-        with patch.object(self.command, "stdout"), patch.object(self.command, "stderr"):
-            with self.assertRaises(SystemExit):
-                self.command.handle(frequency="5 min")
+    def test_handle_exception_logging(self):
+        """Test that exceptions are properly logged."""
+        self.mock_exists.side_effect = _seq(False, True)
+        self.mock_update.side_effect = Exception("Update failed")
+        with (
+            patch.object(cmd.logger, "exception") as mock_exception,
+            self.assertRaises(SystemExit),
+        ):
+            self.command.handle(frequency="5 min")
 
-        mock_logger.exception.assert_called_once_with(
+        mock_exception.assert_called_once_with(
             "Command update_feeds_for_frequency failed: Update failed"
         )
 
-    @patch("core.management.commands.feed_updater.os.remove")
-    @patch("core.management.commands.feed_updater.open", new_callable=mock_open)
-    @patch("core.management.commands.feed_updater.os.path.exists", return_value=False)
-    @patch("core.management.commands.feed_updater.update_feeds_for_frequency")
-    def test_handle_lock_file_creation_and_content(
-        self, mock_update, mock_exists, mock_open_file, mock_remove
-    ):
+    def test_handle_lock_file_creation_and_content(self):
         """Test that lock file is created with correct content (PID)."""
-        # Mock stdout and stderr for the command instance
-        with patch.object(self.command, "stdout"), patch.object(self.command, "stderr"):
-            with patch(
-                "core.management.commands.feed_updater.os.getpid", return_value=12345
-            ):
-                self.command.handle(frequency="hourly")
+        self.mock_exists.return_value = False
+        self.mock_os.getpid.return_value = 12345
+        self.command.handle(frequency="hourly")
 
         expected_lock_path = "/tmp/update_feeds_hourly.lock"
-        mock_open_file.assert_called_with(expected_lock_path, "w")
-
-        handle = mock_open_file.return_value.__enter__.return_value
-        handle.write.assert_called_once_with("12345")
-
-    @patch("core.management.commands.feed_updater.os.remove")
-    @patch("core.management.commands.feed_updater.open", new_callable=mock_open)
-    @patch(
-        "core.management.commands.feed_updater.os.path.exists",
-        side_effect=[False, False],
-    )
-    @patch("core.management.commands.feed_updater.update_feeds_for_frequency")
-    def test_handle_lock_file_cleanup_when_not_exists(
-        self, mock_update, mock_exists, mock_open_file, mock_remove
-    ):
+        self.mock_open.assert_called_with(expected_lock_path, "w")
+
+        self.assertEqual(self.lock_file.writes, ["12345"])
+
+    def test_handle_lock_file_cleanup_when_not_exists(self):
         """Test that remove is not called if lock file doesn't exist in finally block."""
-        # Mock stdout and stderr for the command instance
-        with patch.object(self.command, "stdout"), patch.object(self.command, "stderr"):
-            self.command.handle(frequency="5 min")
-        mock_remove.assert_not_called()
+        self.mock_exists.side_effect = _seq(False, False)
+        self.command.handle(frequency="5 min")
+        self.mock_remove.assert_not_called()
 
     def test_handle_frequency_to_lock_file_mapping(self):
         """Test that frequency strings are correctly converted to lock file names."""
-        for frequency, expected_lock_path in self.frequency_to_lock.items():
-            with self.subTest(frequency=frequency):
-                with patch(
-                    "core.management.commands.feed_updater.os.path.exists",
-                    return_value=True,
-                ) as mock_exists:
-                    with (
-                        patch.object(self.command, "stdout"),
-                        patch.object(self.command, "stderr"),
-                    ):
-                        with self.assertRaises(SystemExit):
-                            self.command.handle(frequency=frequency)
-                    mock_exists.assert_called_with(expected_lock_path)
+        self.mock_exists.return_value = True
+        for frequency, _ in _FREQ_TO_LOCK:
+            with self.assertRaises(SystemExit):
+                self.command.handle(frequency=frequency)
+
+        self.assertEqual(
+            self.mock_exists.call_args_list, [call(path) for _, path in _FREQ_TO_LOCK]
+        )
 
 
 class UpdateSingleFeedTests(SimpleTestCase):
@@ -205,29 +185,30 @@ class UpdateSingleFeedTests(SimpleTestCase):
 
     def setUp(self):
         """Set up test data."""
-        self.mock_feed = Mock()
-        self.mock_feed.name = "Test Feed"
-        self.mock_feed.translate_title = False
-        self.mock_feed.translate_content = False
-        self.mock_feed.summary = False
-
-    def _patch_common_mocks(self):
-        """Helper method to patch common mocks."""
-        patches = [
-            patch("core.management.commands.feed_updater.close_old_connections"),
-            patch("core.management.commands.feed_updater.handle_single_feed_fetch"),
-            patch("core.management.commands.feed_updater.logger"),
-        ]
-        return [p.start() for p in patches]
-
-    @patch("core.management.commands.feed_updater.close_old_connections")
-    @patch("core.management.commands.feed_updater.handle_single_feed_fetch")
-    @patch("core.management.commands.feed_updater.handle_feeds_translation")
-    @patch("core.management.commands.feed_updater.handle_feeds_summary")
-    @patch("core.management.commands.feed_updater.logger")
-    def test_update_single_feed_success_with_all_options(
-        self, mock_logger, mock_summary, mock_translation, mock_fetch, mock_close_conn
-    ):
+        super().setUp()
+        patcher = patch.multiple(
+            cmd,
+            logger=DEFAULT,
+            close_old_connections=DEFAULT,
+            handle_single_feed_fetch=DEFAULT,
+            handle_feeds_translation=DEFAULT,
+            handle_feeds_summary=DEFAULT,
+        )
+        mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_logger = mocks["logger"]
+        self.mock_close_conn = mocks["close_old_connections"]
+        self.mock_fetch = mocks["handle_single_feed_fetch"]
+        self.mock_translation = mocks["handle_feeds_translation"]
+        self.mock_summary = mocks["handle_feeds_summary"]
+        self.mock_feed = SimpleNamespace(
+            name="Test Feed",
+            translate_title=False,
+            translate_content=False,
+            summary=False,
+        )
+
+    def test_update_single_feed_success_with_all_options(self):
         """Test successful feed update with all translation and summary options enabled."""
         self.mock_feed.translate_title = True
         self.mock_feed.translate_content = True
@@ -236,275 +217,236 @@ class UpdateSingleFeedTests(SimpleTestCase):
         result = cmd.update_single_feed(self.mock_feed)
 
         self.assertTrue(result)
-        mock_close_conn.assert_called()
-        mock_fetch.assert_called_once_with(self.mock_feed)
-
-        expected_calls = [
-            call([self.mock_feed], target_field="title"),
-            call([self.mock_feed], target_field="content"),
-        ]
-        mock_translation.assert_has_calls(expected_calls)
-
-        mock_summary.assert_called_once_with([self.mock_feed])
-        mock_logger.info.assert_any_call(f"Starting feed update: {self.mock_feed.name}")
-        mock_logger.info.assert_any_call(
+        self.mock_close_conn.assert_called()
+        self.mock_fetch.assert_called_once_with(self.mock_feed)
+        self.assertEqual(
+            self.mock_translation.call_args_list,
+            [
+                call([self.mock_feed], target_field="title"),
+                call([self.mock_feed], target_field="content"),
+            ],
+        )
+        self.mock_summary.assert_called_once_with([self.mock_feed])
+        self.mock_logger.info.assert_any_call(
+            f"Starting feed update: {self.mock_feed.name}"
+        )
+        self.mock_logger.info.assert_any_call(
             f"Completed feed update: {self.mock_feed.name}"
         )
 
-    @patch("core.management.commands.feed_updater.close_old_connections")
-    @patch("core.management.commands.feed_updater.handle_single_feed_fetch")
-    @patch("core.management.commands.feed_updater.logger")
-    def test_update_single_feed_success_minimal_options(
-        self, mock_logger, mock_fetch, mock_close_conn
-    ):
+    def test_update_single_feed_success_minimal_options(self):
         """Test successful feed update with minimal options (no translation/summary)."""
         result = cmd.update_single_feed(self.mock_feed)
 
         self.assertTrue(result)
-        mock_fetch.assert_called_once_with(self.mock_feed)
-        mock_logger.info.assert_any_call(f"Starting feed update: {self.mock_feed.name}")
-        mock_logger.info.assert_any_call(
+        self.mock_fetch.assert_called_once_with(self.mock_feed)
+        self.mock_translation.assert_not_called()
+        self.mock_summary.assert_not_called()
+        self.mock_logger.info.assert_any_call(
+            f"Starting feed update: {self.mock_feed.name}"
+        )
+        self.mock_logger.info.assert_any_call(
             f"Completed feed update: {self.mock_feed.name}"
         )
 
     def test_update_single_feed_exceptions(self):
         """Test exception handling in update_single_feed."""
-        mock_close_conn, mock_fetch, mock_logger = self._patch_common_mocks()
-
         # Test Feed.DoesNotExist exception
-        from core.models import Feed
-
-        mock_fetch.side_effect = Feed.DoesNotExist("Feed not found")
-        result = cmd.update_single_feed(self.mock_feed)
+        with patch.object(cmd, "Feed", SimpleNamespace(DoesNotExist=_DNE)):
+            self.mock_fetch.side_effect = _DNE("Feed not found")
+            result = cmd.update_single_feed(self.mock_feed)
         self.assertFalse(result)
-        mock_logger.error.assert_called_once_with(
+        self.mock_logger.error.assert_called_once_with(
             f"Feed not found: ID {self.mock_feed.name}"
         )
 
         # Reset mock and test general exception
-        mock_fetch.reset_mock()
-        mock_logger.reset_mock()
-        mock_fetch.side_effect = Exception("Fetch failed")
+        self.mock_fetch.reset_mock(side_effect=True)
+        self.mock_logger.reset_mock()
+        self.mock_fetch.side_effect = Exception("Fetch failed")
 
         result = cmd.update_single_feed(self.mock_feed)
         self.assertFalse(result)
-        mock_logger.exception.assert_called_once_with(
+        self.mock_logger.exception.assert_called_once_with(
             f"Error updating feed ID {self.mock_feed.name}: Fetch failed"
         )
 
-        mock_close_conn.assert_called()
+        self.mock_close_conn.assert_called()
 
 
 class UpdateMultipleFeedsTests(SimpleTestCase):
     """Tests for update_multiple_feeds function."""
 
+    RSS_VARIANTS = (("o", "xml"), ("o", "json"), ("t", "xml"), ("t", "json"))
+    TAG_VARIANTS = (("o", "xml"), ("t", "xml"), ("t", "json"))
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Read-only fixtures; no test mutates them.
+        cls.mock_feed1 = SimpleNamespace(name="Feed 1", slug="feed-1")
+        cls.mock_feed2 = SimpleNamespace(name="Feed 2", slug="feed-2")
+        cls._cached_tags = (
+            SimpleNamespace(slug="tag-1"),
+            SimpleNamespace(slug="tag-2"),
+        )
+
     def setUp(self):
-        """Set up test data."""
-        self.mock_feed1 = Mock()
-        self.mock_feed1.name = "Feed 1"
-        self.mock_feed1.slug = "feed-1"
-        self.mock_feed1.tags.values_list.return_value = [1, 2]
-
-        self.mock_feed2 = Mock()
-        self.mock_feed2.name = "Feed 2"
-        self.mock_feed2.slug = "feed-2"
-        self.mock_feed2.tags.values_list.return_value = [2, 3]
-
-    @patch("core.management.commands.feed_updater.logger")
-    def test_update_multiple_feeds_empty_list(self, mock_logger):
+        super().setUp()
+        patcher = patch.multiple(
+            cmd,
+            task_manager=DEFAULT,
+            wait=DEFAULT,
+            Tag=DEFAULT,
+            logger=DEFAULT,
+            cache_rss_bulk=DEFAULT,
+            cache_tag=DEFAULT,
+        )
+        mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_task_manager = mocks["task_manager"]
+        self.mock_wait = mocks["wait"]
+        self.mock_tag_model = mocks["Tag"]
+        self.mock_logger = mocks["logger"]
+        self.mock_cache_rss_bulk = mocks["cache_rss_bulk"]
+        self.mock_cache_tag = mocks["cache_tag"]
+
+    def _set_tags(self, tags):
+        """Make the Tag query in update_multiple_feeds return `tags`."""
+        tag_query = self.mock_tag_model.objects.filter.return_value.distinct.return_value
+        tag_query.only.return_value = tags
+
+    def test_update_multiple_feeds_empty_list(self):
         """Test update_multiple_feeds with empty feed list."""
         cmd.update_multiple_feeds([])
-        mock_logger.info.assert_called_once_with("No feeds to update.")
+        self.mock_logger.info.assert_called_once_with("No feeds to update.")
 
     def _create_mock_futures(self, success_count=2):
         """Helper method to create mock futures."""
-        futures = []
-        for i in range(success_count):
-            mock_future = Mock()
-            mock_future.result.return_value = True
-            futures.append(mock_future)
-        return futures
+        return [SimpleNamespace(result=lambda: True) for _ in range(success_count)]
 
     def _create_mock_tags(self):
         """Helper method to create mock tags."""
-        mock_tag1 = Mock(slug="tag-1")
-        mock_tag2 = Mock(slug="tag-2")
-        return [mock_tag1, mock_tag2]
-
-    @patch("core.management.commands.feed_updater.task_manager")
-    @patch("core.management.commands.feed_updater.wait")
-    @patch("core.management.commands.feed_updater.cache_rss")
-    @patch("core.management.commands.feed_updater.cache_tag")
-    @patch("core.management.commands.feed_updater.Tag")
-    @patch("core.management.commands.feed_updater.logger")
-    def test_update_multiple_feeds_success(
-        self,
-        mock_logger,
-        mock_tag_model,
-        mock_cache_tag,
-        mock_cache_rss,
-        mock_wait,
-        mock_task_manager,
-    ):
+        return list(self._cached_tags)
+
+    def test_update_multiple_feeds_success(self):
         """Test successful update of multiple feeds with caching."""
         feeds = [self.mock_feed1, self.mock_feed2]
         mock_futures = self._create_mock_futures(2)
-        mock_task_manager.submit_task.side_effect = mock_futures
-        mock_wait.return_value = (mock_futures, [])
-        mock_tag_model.objects.filter.return_value = self._create_mock_tags()
+        self.mock_task_manager.submit_task.side_effect = mock_futures
+        self.mock_wait.side_effect = _wait_all
+        tags = self._create_mock_tags()
+        self._set_tags(tags)
 
         cmd.update_multiple_feeds(feeds)
 
-        # Verify task submission
-        self.assertEqual(mock_task_manager.submit_task.call_count, 2)
-        mock_task_manager.submit_task.assert_any_call(
-            "update_feed_Feed 1", cmd.update_single_feed, self.mock_feed1
-        )
-        mock_task_manager.submit_task.assert_any_call(
-            "update_feed_Feed 2", cmd.update_single_feed, self.mock_feed2
+        # Only feed updates go through the task manager
+        self.assertEqual(
+            self.mock_task_manager.submit_task.call_args_list,
+            [
+                call("update_feed_Feed 1", cmd.update_single_feed, self.mock_feed1),
+                call("update_feed_Feed 2", cmd.update_single_feed, self.mock_feed2),
+            ],
         )
 
-        # Verify wait call
-        mock_wait.assert_called_once_with(mock_futures, timeout=1800)
+        # Verify wait call for the feed updates
+        self.mock_wait.assert_called_once_with(mock_futures, timeout=1800)
 
-        # Verify RSS caching for each feed
-        expected_rss_calls = []
-        for feed in feeds:
-            for feed_type in ["o", "t"]:
-                for format_type in ["xml", "json"]:
-                    expected_rss_calls.append(
-                        call(feed.slug, feed_type=feed_type, format=format_type)
-                    )
+        # Verify one inline bulk RSS caching call per feed
+        self.assertEqual(
+            self.mock_cache_rss_bulk.call_args_list,
+            [call(feed.slug, self.RSS_VARIANTS) for feed in feeds],
+        )
 
-        mock_cache_rss.assert_has_calls(expected_rss_calls, any_order=True)
-
-        # Verify tag caching
-        expected_tag_calls = []
-        for tag in self._create_mock_tags():
-            expected_tag_calls.extend(
-                [
-                    call(tag.slug, feed_type="o", format="xml"),
-                    call(tag.slug, feed_type="t", format="xml"),
-                    call(tag.slug, feed_type="t", format="json"),
-                ]
-            )
-
-        mock_cache_tag.assert_has_calls(expected_tag_calls, any_order=True)
-
-    @patch("core.management.commands.feed_updater.task_manager")
-    @patch("core.management.commands.feed_updater.wait")
-    @patch("core.management.commands.feed_updater.logger")
-    def test_update_multiple_feeds_timeout(
-        self, mock_logger, mock_wait, mock_task_manager
-    ):
+        # Verify tag caching: each (slug, feed_type, format) exactly once
+        expected_tag_calls = {
+            (tag.slug, feed_type, format_type)
+            for tag in tags
+            for feed_type, format_type in self.TAG_VARIANTS
+        }
+        actual_tag_calls = [
+            (args[0], kwargs["feed_type"], kwargs["format"])
+            for args, kwargs in self.mock_cache_tag.call_args_list
+        ]
+        self.assertEqual(len(actual_tag_calls), len(expected_tag_calls))
+        self.assertEqual(set(actual_tag_calls), expected_tag_calls)
+
+    def test_update_multiple_feeds_timeout(self):
         """Test update_multiple_feeds when some tasks timeout."""
         mock_future1, mock_future2 = self._create_mock_futures(2)
-        mock_task_manager.submit_task.return_value = mock_future1
+        self.mock_task_manager.submit_task.return_value = mock_future1
 
-        # Mock timeout scenario
-        mock_wait.return_value = ([mock_future1], [mock_future2])
+        # Mock timeout scenario for the feed updates
+        self.mock_wait.return_value = ([mock_future1], [mock_future2])
 
         cmd.update_multiple_feeds([self.mock_feed1])
 
-        mock_logger.warning.assert_called_once_with(
+        self.mock_logger.warning.assert_called_once_with(
             "Feed update task timed out. 1 tasks did not complete."
         )
 
-    @patch("core.management.commands.feed_updater.task_manager")
-    @patch("core.management.commands.feed_updater.wait")
-    @patch("core.management.commands.feed_updater.cache_rss")
-    @patch("core.management.commands.feed_updater.logger")
-    def test_update_multiple_feeds_task_exception(
-        self, mock_logger, mock_cache_rss, mock_wait, mock_task_manager
-    ):
+    def test_update_multiple_feeds_task_exception(self):
         """Test update_multiple_feeds when a task raises an exception."""
-        mock_future = Mock()
-        mock_future.result.side_effect = Exception("Task failed")
-        mock_task_manager.submit_task.return_value = mock_future
-        mock_wait.return_value = ([mock_future], [])
+        def _raise():
+            raise Exception("Task failed")
+
+        mock_future = SimpleNamespace(result=_raise)
+        self.mock_task_manager.submit_task.return_value = mock_future
+        self.mock_wait.return_value = ([mock_future], [])
 
         cmd.update_multiple_feeds([self.mock_feed1])
 
-        mock_logger.warning.assert_called_once_with(
+        self.mock_logger.warning.assert_called_once_with(
             "A feed update task resulted in an exception: Task failed"
         )
 
-    @patch("core.management.commands.feed_updater.task_manager")
-    @patch("core.management.commands.feed_updater.wait")
-    @patch("core.management.commands.feed_updater.cache_rss")
-    @patch("core.management.commands.feed_updater.logger")
-    def test_update_multiple_feeds_cache_exception(
-        self, mock_logger, mock_cache_rss, mock_wait, mock_task_manager
-    ):
+    def test_update_multiple_feeds_cache_exception(self):
         """Test update_multiple_feeds when RSS caching fails."""
-        mock_future = Mock()
-        mock_task_manager.submit_task.return_value = mock_future
-        mock_wait.return_value = ([mock_future], [])
+        mock_future = SimpleNamespace(result=lambda: None)
+        self.mock_task_manager.submit_task.return_value = mock_future
+        self.mock_wait.side_effect = _wait_all
+        self._set_tags([])
 
-        # First cache call succeeds, second fails
-        mock_cache_rss.side_effect = [None, Exception("Cache failed"), None, None]
+        self.mock_cache_rss_bulk.side_effect = Exception("Cache failed")
 
-        with patch(
-            "core.management.commands.feed_updater.time.time", return_value=1234567890
-        ):
+        with patch.object(cmd.time, "time", return_value=1234567890):
             cmd.update_multiple_feeds([self.mock_feed1])
 
-        mock_logger.error.assert_called_with(
+        self.mock_logger.error.assert_called_with(
             f"1234567890: Failed to cache RSS for {self.mock_feed1.slug}: Cache failed"
         )
 
-    @patch("core.management.commands.feed_updater.task_manager")
-    @patch("core.management.commands.feed_updater.logger")
-    def test_update_multiple_feeds_general_exception(
-        self, mock_logger, mock_task_manager
-    ):
+    def test_update_multiple_feeds_general_exception(self):
         """Test update_multiple_feeds when a general exception occurs."""
-        mock_task_manager.submit_task.side_effect = Exception("General error")
+        self.mock_task_manager.submit_task.side_effect = Exception("General error")
 
         cmd.update_multiple_feeds([self.mock_feed1])
 
-        mock_logger.exception.assert_called_once_with(
+        self.mock_logger.exception.assert_called_once_with(
             "Command update_multiple_feeds failed: %s", "General error"
         )
 
-    @patch("core.management.commands.feed_updater.task_manager")
-    @patch("core.management.commands.feed_updater.wait")
-    @patch("core.management.commands.feed_updater.cache_rss")
-    @patch("core.management.commands.feed_updater.cache_tag")
-    @patch("core.management.commands.feed_updater.Tag")
-    @patch("core.management.commands.feed_updater.logger")
-    def test_update_multiple_feeds_cache_tag_exception(
-        self,
-        mock_logger,
-        mock_tag_model,
-        mock_cache_tag,
-        mock_cache_rss,
-        mock_wait,
-        mock_task_manager,
-    ):
+    def test_update_multiple_feeds_cache_tag_exception(self):
         """Test update_multiple_feeds when tag caching fails."""
-        mock_future = Mock()
-        mock_task_manager.submit_task.return_value = mock_future
-        mock_wait.return_value = ([mock_future], [])
+        mock_future = SimpleNamespace(result=lambda: None)
+        self.mock_task_manager.submit_task.return_value = mock_future
+        self.mock_wait.side_effect = _wait_all
 
         # Mock tags
-        mock_tag1 = Mock(slug="tech-news")
-        mock_tag2 = Mock(slug="ai-updates")
-        mock_tag_model.objects.filter.return_value = [mock_tag1, mock_tag2]
+        mock_tag1 = SimpleNamespace(slug="tech-news")
+        mock_tag2 = SimpleNamespace(slug="ai-updates")
+        self._set_tags([mock_tag1, mock_tag2])
 
         # RSS caching succeeds, but tag caching fails for second tag
-        mock_cache_tag.side_effect = [
-            None,  # tag1: cache_tag(tech-news, feed_type="o", format="xml")
-            None,  # tag1: cache_tag(tech-news, feed_type="t", format="xml")
-            None,  # tag1: cache_tag(tech-news, feed_type="t", format="json")
-            Exception(
-                "Tag cache failed"
-            ),  # tag2: cache_tag(ai-updates, feed_type="o", format="xml") fails
-        ]
+        def _cache_tag(slug, feed_type, format):
+            if (slug, feed_type, format) == ("ai-updates", "o", "xml"):
+                raise Exception("Tag cache failed")
+
+        self.mock_cache_tag.side_effect = _cache_tag
 
         cmd.update_multiple_feeds([self.mock_feed1])
 
-        mock_logger.error.assert_called_with(
+        self.mock_logger.error.assert_called_with(
             f"Failed to cache tag {mock_tag2.slug}: Tag cache failed"
         )
 
@@ -512,6 +454,11 @@ class UpdateMultipleFeedsTests(SimpleTestCase):
 class UpdateFeedsForFrequencyTests(SimpleTestCase):
     """Tests for update_feeds_for_frequency function."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._TWO_FEEDS = (SimpleNamespace(), SimpleNamespace())
+
     def setUp(self):
         """Set up test data."""
         self.frequency_mapping = {
@@ -523,23 +470,18 @@ class UpdateFeedsForFrequencyTests(SimpleTestCase):
             "weekly": 10080,
         }
 
-    @patch("core.management.commands.feed_updater.Feed")
-    @patch("core.management.commands.feed_updater.update_multiple_feeds")
-    @patch("core.management.commands.feed_updater.logger")
+    @patch.object(cmd, "Feed")
+    @patch.object(cmd, "update_multiple_feeds")
+    @patch.object(cmd, "logger")
     def test_update_feeds_for_frequency_success(
         self, mock_logger, mock_update_multiple, mock_feed_model
     ):
         """Test successful update_feeds_for_frequency call."""
-        mock_feed1, mock_feed2 = Mock(), Mock()
-        mock_feeds_iterator = iter([mock_feed1, mock_feed2])
-
-        mock_feed_model.objects.filter.return_value.iterator.return_value = (
-            mock_feeds_iterator
+        mock_feed_model.objects.filter.return_value.iterator.return_value = iter(
+            self._TWO_FEEDS
         )
 
-        with patch(
-            "core.management.commands.feed_updater.current_time", "2024-01-01 12:00:00"
-        ):
+        with patch.object(cmd, "current_time", "2024-01-01 12:00:00"):
             cmd.update_feeds_for_frequency("hourly")
 
         mock_feed_model.objects.filter.assert_called_once_with(update_frequency=60)
@@ -550,79 +492,69 @@ class UpdateFeedsForFrequencyTests(SimpleTestCase):
         args = mock_update_multiple.call_args[0][0]
         self.assertEqual(len(args), 2)
 
-    @patch("core.management.commands.feed_updater.logger")
+    @patch.object(cmd, "logger")
     def test_update_feeds_for_frequency_invalid_frequency(self, mock_logger):
         """Test update_feeds_for_frequency with invalid frequency."""
         cmd.update_feeds_for_frequency("invalid")
         mock_logger.error.assert_called_once_with("Invalid frequency: invalid")
 
-    @patch("core.management.commands.feed_updater.Feed")
-    @patch("core.management.commands.feed_updater.update_multiple_feeds")
-    @patch("core.management.commands.feed_updater.logger")
+    @patch.object(cmd, "Feed")
+    @patch.object(cmd, "update_multiple_feeds")
+    @patch.object(cmd, "logger")
     def test_update_feeds_for_frequency_exception(
         self, mock_logger, mock_update_multiple, mock_feed_model
     ):
         """Test update_feeds_for_frequency when an exception occurs."""
         mock_feed_model.objects.filter.side_effect = Exception("Database error")
 
-        with patch(
-            "core.management.commands.feed_updater.current_time", "2024-01-01 12:00:00"
-        ):
-            cmd.update_feeds_for_frequency("daily")
+        cmd.update_feeds_for_frequency("daily")
 
         mock_logger.exception.assert_called_once_with(
-            "2024-01-01 12:00:00: Command update_feeds_for_frequency daily: Database error"
+            "Command update_feeds_for_frequency %s failed", "daily"
         )
 
-    @patch("core.management.commands.feed_updater.Feed")
-    @patch("core.management.commands.feed_updater.update_multiple_feeds")
-    @patch("core.management.commands.feed_updater.logger")
+    @patch.object(cmd, "Feed")
+    @patch.object(cmd, "update_multiple_feeds")
+    @patch.object(cmd, "logger")
     def test_update_feeds_for_frequency_all_frequencies(
         self, mock_logger, mock_update_multiple, mock_feed_model
     ):
         """Test update_feeds_for_frequency with all valid frequencies."""
-        mock_feed_model.objects.filter.return_value.iterator.return_value = iter([])
+        mock_feed_model.objects.filter.return_value.iterator.side_effect = _empty_iter
 
-        for frequency, expected_value in self.frequency_mapping.items():
+        for frequency, minutes in self.frequency_mapping.items():
             with self.subTest(frequency=frequency):
-                mock_feed_model.reset_mock()
+                mock_feed_model.objects.filter.reset_mock()
+
                 cmd.update_feeds_for_frequency(frequency)
+
                 mock_feed_model.objects.filter.assert_called_once_with(
-                    update_frequency=expected_value
+                    update_frequency=minutes
                 )
 
 
 class AddArgumentsTests(SimpleTestCase):
     """Tests for `Command.add_arguments` method."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.command = cmd.Command()
-        self.parser = ArgumentParser()
-        self.valid_frequencies = [
-            "5 min",
-            "15 min",
-            "30 min",
-            "hourly",
-            "daily",
-            "weekly",
-        ]
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # parse_args leaves the parser untouched, so build and populate it once.
+        cls.command = cmd.Command()
+        cls.parser = ArgumentParser()
+        cls.command.add_arguments(cls.parser)
+        cls.frequency_action = cls.parser._option_string_actions.get("--frequency")
+
+    valid_frequencies = _VALID_FREQS
 
     def test_add_arguments_adds_frequency_parameter(self):
         """Test that add_arguments correctly adds the --frequency parameter."""
-        self.command.add_arguments(self.parser)
         parsed_args = self.parser.parse_args(["--frequency", "5 min"])
         self.assertEqual(parsed_args.frequency, "5 min")
 
     def test_add_arguments_frequency_parameter_properties(self):
         """Test that the --frequency parameter has correct properties."""
-        self.command.add_arguments(self.parser)
-
-        frequency_action = None
-        for action in self.parser._actions:
-            if "--frequency" in action.option_strings:
-                frequency_action = action
-                break
+        frequency_action = self.frequency_action
 
         self.assertIsNotNone(frequency_action, "Frequency parameter should be added")
         self.assertEqual(
@@ -635,21 +567,18 @@ class AddArgumentsTests(SimpleTestCase):
 
     def test_add_arguments_frequency_parameter_optional(self):
         """Test that --frequency parameter is optional."""
-        self.command.add_arguments(self.parser)
         parsed_args = self.parser.parse_args([])
         self.assertIsNone(parsed_args.frequency)
 
     def test_add_arguments_frequency_parameter_valid_values(self):
         """Test that --frequency parameter accepts valid frequency values."""
-        self.command.add_arguments(self.parser)
-
-        for frequency in self.valid_frequencies:
-            with self.subTest(frequency=frequency):
-                parsed_args = self.parser.parse_args(["--frequency", frequency])
-                self.assertEqual(parsed_args.frequency, frequency)
+        results = {
+            f: self.parser.parse_args(["--frequency", f]).frequency
+            for f in self.valid_frequencies
+        }
+        self.assertEqual(results, {f: f for f in self.valid_frequencies})
 
     def test_add_arguments_frequency_without_value(self):
         """Test that --frequency can be specified without a value (nargs='?')."""
-        self.command.add_arguments(self.parser)
         parsed_args = self.parser.parse_args(["--frequency"])
         self.assertIsNone(parsed_args.frequency)
@@ -1,5 +1,5 @@
 from django.test import TestCase
-from unittest.mock import patch, Mock
+from unittest.mock import DEFAULT, patch
 from concurrent.futures import Future
 
 from core.management.commands import feed_updater as cmd
@@ -10,59 +10,73 @@ from core.models import Feed, Tag
 class UpdateMultipleFeedsTests(TestCase):
     """Unit tests for update_multiple_feeds helper."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.tag = Tag.objects.create(name="Tech")
-        self.feed1 = Feed.objects.create(feed_url="https://a.com/rss.xml", name="A")
-        self.feed1.tags.add(self.tag)
-        self.feed2 = Feed.objects.create(feed_url="https://b.com/rss.xml", name="B")
-        # no tag for feed2
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the class."""
+        (cls.tag,) = Tag.objects.bulk_create([Tag(name="Tech")])
+        # bulk_create skips Feed.save(), so give each feed its slug up front.
+        cls.feed1, cls.feed2 = Feed.objects.bulk_create(
+            [
+                Feed(feed_url="https://a.com/rss.xml", name="A", slug="a"),
+                Feed(feed_url="https://b.com/rss.xml", name="B", slug="b"),
+            ]
+        )
+        # Only feed1 is tagged.
+        Feed.tags.through.objects.bulk_create(
+            [Feed.tags.through(feed_id=cls.feed1.id, tag_id=cls.tag.id)]
+        )
 
-    def _create_mock_future(self, result=True):
-        """Helper method to create mock future."""
-        future = Mock(spec=Future)
-        future.result.return_value = result
+    def _resolved_future(self, result=True):
+        """Return a real Future already completed with `result`."""
+        future = Future()
+        future.set_result(result)
         return future
 
-    @patch("core.management.commands.feed_updater.cache_tag")
-    @patch("core.management.commands.feed_updater.cache_rss")
-    @patch("core.management.commands.feed_updater.wait")
-    @patch("core.management.commands.feed_updater.task_manager")
-    def test_update_multiple_feeds_basic(
-        self, mock_tm, mock_wait, mock_cache_rss, mock_cache_tag
-    ):
+    @patch.multiple(
+        cmd,
+        cache_tag=DEFAULT,
+        cache_rss_bulk=DEFAULT,
+        wait=DEFAULT,
+        task_manager=DEFAULT,
+    )
+    def test_update_multiple_feeds_basic(self, **mocks):
         """Ensure submit_task called and caching functions called for each feed."""
+        mock_tm, mock_wait = mocks["task_manager"], mocks["wait"]
         feeds = [self.feed1, self.feed2]
-        mock_futures = [self._create_mock_future() for _ in feeds]
+        futures = [self._resolved_future() for _ in feeds]
 
         # Mock submit_task to return completed futures
-        mock_tm.submit_task.side_effect = mock_futures
+        mock_tm.submit_task.side_effect = futures
         # Mock wait returns all in done
-        mock_wait.return_value = (set(mock_futures), set())
+        mock_wait.return_value = (set(futures), set())
 
-        cmd.update_multiple_feeds(feeds)
+        # Tags for every feed are resolved with a single query
+        with self.assertNumQueries(1):
+            cmd.update_multiple_feeds(feeds)
 
-        # Two tasks submitted
+        # Only the two feed update tasks go through the task manager
         self.assertEqual(mock_tm.submit_task.call_count, 2)
-        # cache_rss called 4 times per feed (o/xml, o/json, t/xml, t/json)
-        self.assertEqual(mock_cache_rss.call_count, 4 * len(feeds))
+        # cache_rss_bulk called inline once per feed with all four variants
+        self.assertEqual(mocks["cache_rss_bulk"].call_count, len(feeds))
         # cache_tag should be called three times (o/xml, t/xml, t/json) for feed1 only
-        self.assertEqual(mock_cache_tag.call_count, 3)
+        self.assertEqual(mocks["cache_tag"].call_count, 3)
 
-    @patch("core.management.commands.feed_updater.wait")
-    @patch("core.management.commands.feed_updater.task_manager")
+    @patch.object(cmd, "wait")
+    @patch.object(cmd, "task_manager")
     def test_update_multiple_feeds_timeout(self, mock_tm, mock_wait):
         """If wait returns not_done set, should still proceed without raising."""
-        mock_future = self._create_mock_future()
-        mock_tm.submit_task.return_value = mock_future
+        future = self._resolved_future()
+        mock_tm.submit_task.return_value = future
 
         # Wait returns one future in not_done to simulate timeout
-        mock_wait.return_value = (set(), {mock_future})
+        mock_wait.return_value = (set(), {future})
 
         # Should not raise
         cmd.update_multiple_feeds([self.feed1])
 
-        # Verify task was submitted
-        mock_tm.submit_task.assert_called_once()
-        # Verify wait was called with timeout
-        mock_wait.assert_called_once_with([mock_future], timeout=1800)
+        # Verify the feed update task was the only submission
+        mock_tm.submit_task.assert_called_once_with(
+            "update_feed_A", cmd.update_single_feed, self.feed1
+        )
+        # Verify the feed wait was called once, with timeout
+        mock_wait.assert_called_once_with([future], timeout=1800)
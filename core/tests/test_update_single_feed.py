@@ -1,5 +1,5 @@
 import logging
-from unittest.mock import patch, Mock
+from unittest.mock import DEFAULT, patch, Mock
 
 from django.test import TestCase
 
@@ -11,16 +11,40 @@ from core.models import Feed
 class UpdateSingleFeedTests(TestCase):
     """Unit tests for helper `update_single_feed`."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.feed = Feed.objects.create(
-            feed_url="https://example.com/rss.xml",
-            name="Example",
-            translate_title=False,
-            translate_content=False,
-            summary=False,
+    _NOT_FOUND_MSG = "Feed not found: ID Example"
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Patched identically for every test; only call history differs.
+        for attr, name in (
+            ("mock_close_conn", "close_old_connections"),
+            ("mock_logger", "logger"),
+        ):
+            patcher = patch.object(cmd, name)
+            setattr(cls, attr, patcher.start())
+            cls.addClassCleanup(patcher.stop)
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the class."""
+        (cls.feed,) = Feed.objects.bulk_create(
+            [
+                Feed(
+                    feed_url="https://example.com/rss.xml",
+                    name="Example",
+                    slug="example",
+                    translate_title=False,
+                    translate_content=False,
+                    summary=False,
+                )
+            ]
         )
 
+    def setUp(self):
+        self.mock_close_conn.reset_mock()
+        self.mock_logger.reset_mock()
+
     def _create_feed_with_options(self, **kwargs):
         """Create a feed with specific options."""
         feed = Feed.objects.create(
@@ -35,32 +59,30 @@ class UpdateSingleFeedTests(TestCase):
         feed.save()
         return feed
 
-    @patch("core.management.commands.feed_updater.close_old_connections")
-    @patch("core.management.commands.feed_updater.handle_feeds_summary")
-    @patch("core.management.commands.feed_updater.handle_feeds_translation")
-    @patch("core.management.commands.feed_updater.handle_single_feed_fetch")
-    def test_update_single_feed_success(
-        self, mock_fetch, mock_translate, mock_summary, mock_close_conn
-    ):
+    @patch.multiple(
+        cmd,
+        handle_feeds_summary=DEFAULT,
+        handle_feeds_translation=DEFAULT,
+        handle_single_feed_fetch=DEFAULT,
+    )
+    def test_update_single_feed_success(self, **mocks):
         """When no internal task raises, should return True and call helpers."""
         feed = self._create_feed_with_options(translate_title=True, summary=True)
 
         result = cmd.update_single_feed(feed)
 
         self.assertTrue(result)
-        mock_fetch.assert_called_once_with(feed)
+        mocks["handle_single_feed_fetch"].assert_called_once_with(feed)
         # translate should be called for title only (translate_content False)
-        mock_translate.assert_called_once_with([feed], target_field="title")
-        mock_summary.assert_called_once_with([feed])
+        mocks["handle_feeds_translation"].assert_called_once_with(
+            [feed], target_field="title"
+        )
+        mocks["handle_feeds_summary"].assert_called_once_with([feed])
         # close_old_connections should be called twice (entering & finally)
-        self.assertGreaterEqual(mock_close_conn.call_count, 2)
-
-    @patch("core.management.commands.feed_updater.logger")
-    @patch("core.management.commands.feed_updater.close_old_connections")
-    @patch("core.management.commands.feed_updater.handle_single_feed_fetch")
-    def test_update_single_feed_exception(
-        self, mock_fetch, mock_close_conn, mock_logger
-    ):
+        self.assertGreaterEqual(self.mock_close_conn.call_count, 2)
+
+    @patch.object(cmd, "handle_single_feed_fetch")
+    def test_update_single_feed_exception(self, mock_fetch):
         """If internal helper raises, function should swallow and return False."""
         mock_fetch.side_effect = RuntimeError("boom")
 
@@ -69,38 +91,32 @@ class UpdateSingleFeedTests(TestCase):
         self.assertFalse(result)
         mock_fetch.assert_called_once_with(self.feed)
         # Verify logger.exception was called
-        mock_logger.exception.assert_called_once()
+        self.mock_logger.exception.assert_called_once()
         # Ensure finally block executed
-        self.assertGreaterEqual(mock_close_conn.call_count, 2)
-
-    @patch("core.management.commands.feed_updater.close_old_connections")
-    @patch("core.management.commands.feed_updater.handle_single_feed_fetch")
-    @patch("core.management.commands.feed_updater.logger")
-    def test_update_single_feed_feed_not_exist(
-        self, mock_logger, mock_fetch, mock_close_conn
-    ):
+        self.assertGreaterEqual(self.mock_close_conn.call_count, 2)
+
+    @patch.object(cmd, "handle_single_feed_fetch")
+    def test_update_single_feed_feed_not_exist(self, mock_fetch):
         """Test handling of Feed.DoesNotExist exception."""
         mock_fetch.side_effect = Feed.DoesNotExist("Feed not found")
 
         result = cmd.update_single_feed(self.feed)
 
         self.assertFalse(result)
-        mock_logger.error.assert_called_once_with(
-            f"Feed not found: ID {self.feed.name}"
-        )
-        mock_close_conn.assert_called()
-
-    @patch("core.management.commands.feed_updater.close_old_connections")
-    @patch("core.management.commands.feed_updater.handle_single_feed_fetch")
-    @patch("core.management.commands.feed_updater.logger")
-    def test_update_single_feed_no_translation_or_summary(
-        self, mock_logger, mock_fetch, mock_close_conn
-    ):
+        self.mock_logger.error.assert_called_once_with(self._NOT_FOUND_MSG)
+        self.mock_close_conn.assert_called()
+
+    @patch.object(cmd, "handle_single_feed_fetch")
+    def test_update_single_feed_no_translation_or_summary(self, mock_fetch):
         """Test feed update without translation or summary."""
         result = cmd.update_single_feed(self.feed)
 
         self.assertTrue(result)
         mock_fetch.assert_called_once_with(self.feed)
-        mock_logger.info.assert_any_call(f"Starting feed update: {self.feed.name}")
-        mock_logger.info.assert_any_call(f"Completed feed update: {self.feed.name}")
-        mock_close_conn.assert_called()
+        self.mock_logger.info.assert_any_call(
+            f"Starting feed update: {self.feed.name}"
+        )
+        self.mock_logger.info.assert_any_call(
+            f"Completed feed update: {self.feed.name}"
+        )
+        self.mock_close_conn.assert_called()
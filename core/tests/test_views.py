@@ -1,42 +1,219 @@
-from django.test import TestCase, RequestFactory
+from django.test import SimpleTestCase, TestCase, RequestFactory
 from django.http import Http404, JsonResponse
 from unittest.mock import patch, MagicMock
 from django.core.files.uploadedfile import InMemoryUploadedFile
-from django.urls import reverse
-from django.contrib.messages.storage.fallback import FallbackStorage
+from django.urls import resolve, reverse
+from django.utils import timezone
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.contrib.messages.storage.cookie import CookieStorage
 import io
 import json
 
 from ..models import Feed, Tag
-from ..views import rss, tag as tag_view, import_opml
-
-
-class ViewsTestCase(TestCase):
-    def setUp(self):
-        self.factory = RequestFactory()
-        self.feed = Feed.objects.create(
-            name="Test Feed", feed_url="https://example.com/rss.xml", slug="test-feed"
-        )
-        self.tag = Tag.objects.create(name="Test Tag", slug="test-tag")
-
-    def _create_opml_file(self, content, filename="test.opml"):
-        """Helper method to create OPML file for testing."""
+from ..views import digest, digest_view, rss, tag as tag_view, import_opml
+
+# Resolved once at import; every redirect assertion compares against it.
+_ADMIN_CHANGELIST_URL = reverse("admin:core_feed_changelist")
+
+
+class _ViewsTestMixin:
+    """Request/upload helpers shared by the view test cases."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.factory = RequestFactory()
+
+    # OPML payloads are encoded once; each test wraps them in a fresh upload.
+    _OPML_SUCCESS_BYTES = b"""
+    <opml version="2.0">
+        <body>
+            <outline text="Feed 1" title="Feed 1" type="rss" xmlUrl="http://example.com/feed1.xml" />
+        </body>
+    </opml>
+    """
+    _OPML_NESTED_BYTES = b"""
+    <opml version="2.0">
+        <body>
+            <outline text="News">
+                <outline text="Tech News" title="Tech News" type="rss" xmlUrl="http://example.com/technews.xml" />
+            </outline>
+        </body>
+    </opml>
+    """
+    _OPML_TAGGED_BYTES = b"""
+    <opml version="2.0">
+        <body>
+            <outline text="Technology">
+                <outline text="Tech Blog" title="Tech Blog" type="rss" xmlUrl="http://example.com/tech.xml" />
+            </outline>
+        </body>
+    </opml>
+    """
+    _OPML_INVALID_BYTES = b"<opml version='2.0'><head></head></opml>"
+    _OPML_MALFORMED_BYTES = b"<opml version='2.0'><body><outline>"
+
+    def _make_upload(self, data, name="test.opml"):
+        """Wrap OPML bytes in an in-memory upload for `import_opml`."""
         return InMemoryUploadedFile(
-            file=io.BytesIO(content.encode("utf-8")),
+            file=io.BytesIO(data),
             field_name="opml_file",
-            name=filename,
+            name=name,
             content_type="application/xml",
-            size=len(content),
+            size=len(data),
             charset="utf-8",
         )
 
     def _setup_request_with_messages(self, request):
         """Helper method to setup request with messages."""
-        setattr(request, "session", "session")
-        messages = FallbackStorage(request)
+        # Cookie storage alone holds these few messages; no session needed.
+        messages = CookieStorage(request)
         setattr(request, "_messages", messages)
         return messages
 
+
+class ViewsNoDbTests(_ViewsTestMixin, SimpleTestCase):
+    """View paths that never reach the database; model managers are mocked."""
+
+    def test_digest_urls_reverse_with_trailing_slash(self):
+        """Named digest routes reverse to the slash form; both forms resolve."""
+        for name, view in (
+            ("digest_view", digest_view),
+            ("digest_json", digest),
+            ("digest_rss", digest),
+        ):
+            with self.subTest(name=name):
+                url = reverse(f"core:{name}", args=["daily"])
+                self.assertTrue(url.endswith("/daily/"))
+                self.assertIs(resolve(url).func, view)
+                self.assertIs(resolve(url.rstrip("/")).func, view)
+
+    @patch("core.views.cache_rss", side_effect=Feed.DoesNotExist)
+    @patch("core.views.cache")
+    @patch("core.views.Feed.objects")
+    def test_rss_feed_view_not_found(self, mock_objects, mock_cache, _mock_cache_rss):
+        """Test the rss view when the feed is not found."""
+        mock_objects.filter.return_value.values.return_value.first.return_value = None
+        mock_cache.get.return_value = None  # Cache miss
+
+        request = self.factory.get("/rss/non-existent-slug")
+        response = rss(request, "non-existent-slug")
+        self.assertEqual(response.status_code, 404)
+
+    @patch("core.views.Tag.objects")
+    def test_tag_view_not_found(self, mock_objects):
+        """Test the tag view when the tag is not found."""
+        mock_objects.filter.return_value.exists.return_value = False
+
+        request = self.factory.get("/tag/non-existent-tag")
+        response = tag_view(request, "non-existent-tag")
+        self.assertEqual(response.status_code, 404)
+        mock_objects.filter.assert_called_once_with(slug="non-existent-tag")
+
+    def test_import_opml_invalid_file(self):
+        """Test importing an invalid OPML file (missing body)."""
+        opml_file = self._make_upload(self._OPML_INVALID_BYTES, "invalid.opml")
+        request = self.factory.post("/fake-url", {"opml_file": opml_file})
+        messages = self._setup_request_with_messages(request)
+
+        with patch("core.views.Feed.objects") as mock_objects:
+            import_opml(request)
+
+        self.assertEqual(mock_objects.mock_calls, [])
+        self.assertTrue(
+            any(str(m) == "Invalid OPML: Missing body element" for m in messages)
+        )
+
+    def test_import_opml_get_request(self):
+        """Test the import_opml view with GET request."""
+        request = self.factory.get("/fake-url")
+        response = import_opml(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, _ADMIN_CHANGELIST_URL)
+
+    def test_import_opml_no_file_uploaded(self):
+        """Test the import_opml view when no file is uploaded."""
+        request = self.factory.post("/fake-url", {})
+        messages = self._setup_request_with_messages(request)
+
+        response = import_opml(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            any(str(m) == "Please upload a valid OPML file." for m in messages)
+        )
+
+    def test_import_opml_invalid_file_type(self):
+        """Test the import_opml view with invalid file type."""
+        # Create a mock file that's not InMemoryUploadedFile
+        mock_file = MagicMock()
+        mock_file.name = "test.txt"
+
+        request = self.factory.post("/fake-url", {"opml_file": mock_file})
+        messages = self._setup_request_with_messages(request)
+
+        response = import_opml(request)
+
+        self.assertEqual(response.status_code, 302)
+        # The mock file will cause XML parsing error, so we check for that instead
+        self.assertTrue(any("XML syntax error:" in str(m) for m in messages))
+
+    def test_import_opml_xml_syntax_error(self):
+        """Test the import_opml view with XML syntax error."""
+        opml_file = self._make_upload(self._OPML_MALFORMED_BYTES, "invalid.opml")
+        request = self.factory.post("/fake-url", {"opml_file": opml_file})
+        messages = self._setup_request_with_messages(request)
+
+        with patch("core.views.Feed.objects") as mock_objects:
+            import_opml(request)
+
+        self.assertEqual(mock_objects.mock_calls, [])
+        self.assertTrue(any("XML syntax error:" in str(m) for m in messages))
+
+    def test_import_opml_general_exception(self):
+        """Test the import_opml view with general exception."""
+        opml_file = self._make_upload(self._OPML_SUCCESS_BYTES, "feeds.opml")
+        request = self.factory.post("/fake-url", {"opml_file": opml_file})
+        messages = self._setup_request_with_messages(request)
+
+        # Make the existing-feed lookup raise; no real transaction is opened
+        with patch("core.views.transaction"), patch(
+            "core.views.Feed.objects"
+        ) as mock_objects:
+            mock_objects.filter.side_effect = Exception("Database error")
+            import_opml(request)
+
+        mock_objects.bulk_create.assert_not_called()
+        self.assertTrue(
+            any(str(m) == "Error importing OPML file: Database error" for m in messages)
+        )
+
+
+class ViewsDbTests(_ViewsTestMixin, TestCase):
+    """View paths that read fixture rows or write imported feeds."""
+
+    @staticmethod
+    def _bulk_opml_bytes(tag_name, count):
+        """OPML with `count` feeds under one `tag_name` outline."""
+        return (
+            b'<opml version="2.0"><body><outline text="%s">' % tag_name
+            + b"".join(
+                b'<outline text="Feed %d" type="rss" '
+                b'xmlUrl="http://example.com/%s/%d.xml" />' % (i, tag_name, i)
+                for i in range(count)
+            )
+            + b"</outline></body></opml>"
+        )
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.feed = Feed.objects.create(
+            name="Test Feed", feed_url="https://example.com/rss.xml", slug="test-feed"
+        )
+        cls.tag = Tag.objects.create(name="Test Tag", slug="test-tag")
+
     @patch("core.views.cache")
     @patch("core.views.cache_rss")
     def test_rss_feed_view_found(self, mock_cache_rss, mock_cache):
@@ -47,17 +224,27 @@ class ViewsTestCase(TestCase):
         )
 
         request = self.factory.get(f"/rss/{self.feed.slug}")
-        response = rss(request, self.feed.slug)
+        # The etag and last-modified callbacks share one row lookup
+        with self.assertNumQueries(1):
+            response = rss(request, self.feed.slug)
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/xml; charset=utf-8")
         mock_cache_rss.assert_called_once_with(self.feed.slug, "t", "xml")
 
-    def test_rss_feed_view_not_found(self):
-        """Test the rss view when the feed is not found."""
-        request = self.factory.get("/rss/non-existent-slug")
-        response = rss(request, "non-existent-slug")
-        self.assertEqual(response.status_code, 404)
+    @patch("core.views.cache")
+    @patch("core.views.cache_rss")
+    def test_rss_validators_are_read_per_request(self, mock_cache_rss, mock_cache):
+        """Each request re-reads the validators, so updates show up at once."""
+        mock_cache.get.return_value = "<rss></rss>"  # Cache hit
+
+        first = rss(self.factory.get(f"/rss/{self.feed.slug}"), self.feed.slug)
+        # bulk_update-style write: no save() and no signal
+        Feed.objects.filter(pk=self.feed.pk).update(last_translate=timezone.now())
+        with self.assertNumQueries(1):
+            second = rss(self.factory.get(f"/rss/{self.feed.slug}"), self.feed.slug)
+
+        self.assertNotEqual(first.get("ETag"), second.get("ETag"))
 
     @patch("core.views.cache")
     @patch("core.views.cache_tag")
@@ -75,105 +262,63 @@ class ViewsTestCase(TestCase):
         self.assertEqual(response["Content-Type"], "application/xml; charset=utf-8")
         mock_cache_tag.assert_called_once_with(self.tag.slug, "t", "xml")
 
-    def test_tag_view_not_found(self):
-        """Test the tag view when the tag is not found."""
-        request = self.factory.get("/tag/non-existent-tag")
-        response = tag_view(request, "non-existent-tag")
-        self.assertEqual(response.status_code, 404)
-
     def test_import_opml_success(self):
         """Test the import_opml view with a valid OPML file."""
-        opml_content = """
-        <opml version="2.0">
-            <body>
-                <outline text="Feed 1" title="Feed 1" type="rss" xmlUrl="http://example.com/feed1.xml" />
-            </body>
-        </opml>
-        """
-        opml_file = self._create_opml_file(opml_content, "feeds.opml")
+        opml_file = self._make_upload(self._OPML_SUCCESS_BYTES, "feeds.opml")
         request = self.factory.post("/fake-url", {"opml_file": opml_file})
         messages = self._setup_request_with_messages(request)
 
         initial_feed_count = Feed.objects.count()
-        response = import_opml(request)
+        # SAVEPOINT/RELEASE around one lookup of existing feeds and one bulk INSERT
+        with self.assertNumQueries(4):
+            response = import_opml(request)
 
         self.assertEqual(response.status_code, 302)
-        self.assertEqual(response.url, reverse("admin:core_feed_changelist"))
+        self.assertEqual(response.url, _ADMIN_CHANGELIST_URL)
         self.assertEqual(Feed.objects.count(), initial_feed_count + 1)
         self.assertTrue(
             Feed.objects.filter(feed_url="http://example.com/feed1.xml").exists()
         )
-        self.assertIn("OPML file imported successfully.", [str(m) for m in messages])
+        self.assertTrue(
+            any(str(m) == "OPML file imported successfully." for m in messages)
+        )
 
     def test_import_opml_with_nested_categories(self):
         """Test importing an OPML file with nested categories."""
-        opml_content = """
-        <opml version="2.0">
-            <body>
-                <outline text="News">
-                    <outline text="Tech News" title="Tech News" type="rss" xmlUrl="http://example.com/technews.xml" />
-                </outline>
-            </body>
-        </opml>
-        """
-        opml_file = self._create_opml_file(opml_content, "nested.opml")
+        opml_file = self._make_upload(self._OPML_NESTED_BYTES, "nested.opml")
         request = self.factory.post("/fake-url", {"opml_file": opml_file})
         self._setup_request_with_messages(request)
 
         import_opml(request)
 
         self.assertTrue(
-            Feed.objects.filter(feed_url="http://example.com/technews.xml").exists()
+            Feed.objects.filter(
+                feed_url="http://example.com/technews.xml", tags__name="News"
+            ).exists()
         )
-        new_feed = Feed.objects.get(feed_url="http://example.com/technews.xml")
-        self.assertTrue(new_feed.tags.filter(name="News").exists())
-
-    def test_import_opml_invalid_file(self):
-        """Test importing an invalid OPML file (missing body)."""
-        opml_content = "<opml version='2.0'><head></head></opml>"
-        opml_file = self._create_opml_file(opml_content, "invalid.opml")
-        request = self.factory.post("/fake-url", {"opml_file": opml_file})
-        messages = self._setup_request_with_messages(request)
 
-        initial_feed_count = Feed.objects.count()
-        import_opml(request)
-
-        self.assertEqual(Feed.objects.count(), initial_feed_count)
-        self.assertIn("Invalid OPML: Missing body element", [str(m) for m in messages])
-
-    @patch("core.views.feed2json")
     @patch("core.views.cache")
     @patch("core.views.cache_rss")
-    def test_rss_view_json_format(self, mock_cache_rss, mock_cache, mock_feed2json):
-        """Test the rss view with format='json'."""
+    def test_rss_view_json_format(self, mock_cache_rss, mock_cache):
+        """Test the rss view with format='json' returns the cached JSON as-is."""
         mock_cache.get.return_value = None  # Cache miss
-        mock_cache_rss.return_value = (
-            "<rss><channel><title>Test Feed</title></channel></rss>"
-        )
-        mock_feed2json.return_value = {"title": "JSON Feed"}
+        mock_cache_rss.return_value = '{"title": "JSON Feed"}'
 
         request = self.factory.get(f"/rss/{self.feed.slug}")
         response = rss(request, self.feed.slug, feed_type="o", format="json")
 
         mock_cache_rss.assert_called_once_with(self.feed.slug, "o", "json")
-        mock_feed2json.assert_called_once_with(
-            "<rss><channel><title>Test Feed</title></channel></rss>"
-        )
-        self.assertIsInstance(response, JsonResponse)
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
         json_content = json.loads(response.content)
         self.assertEqual(json_content["title"], "JSON Feed")
 
-    @patch("core.views.feed2json")
     @patch("core.views.cache")
     @patch("core.views.cache_rss")
-    def test_rss_view_json_format_no_feed_data(
-        self, mock_cache_rss, mock_cache, mock_feed2json
-    ):
+    def test_rss_view_json_format_no_feed_data(self, mock_cache_rss, mock_cache):
         """Test the rss view with format='json' when no feed data is available."""
         mock_cache.get.return_value = None  # Cache miss
         mock_cache_rss.return_value = None  # No feed data
-        mock_feed2json.return_value = {"title": "JSON Feed"}
 
         request = self.factory.get(f"/rss/{self.feed.slug}")
         response = rss(request, self.feed.slug, format="json")
@@ -196,8 +341,7 @@ class ViewsTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/xml; charset=utf-8")
         # Check that error message is in the response content
-        response_content = b"".join(response.streaming_content)
-        self.assertIn(b"<error>No feed data available</error>", response_content)
+        self.assertIn(b"<error>No feed data available</error>", response.content)
 
     @patch("core.views.cache")
     @patch("core.views.cache_rss")
@@ -216,8 +360,7 @@ class ViewsTestCase(TestCase):
         # Should not call cache_rss when cache hits
         mock_cache_rss.assert_not_called()
         # Check that cached content is returned
-        response_content = b"".join(response.streaming_content)
-        self.assertEqual(response_content, cached_content.encode())
+        self.assertEqual(response.content, cached_content.encode())
 
     @patch("core.views.cache")
     @patch("core.views.cache_tag")
@@ -236,8 +379,7 @@ class ViewsTestCase(TestCase):
         # Should not call cache_tag when cache hits
         mock_cache_tag.assert_not_called()
         # Check that cached content is returned
-        response_content = b"".join(response.streaming_content)
-        self.assertEqual(response_content, cached_content.encode())
+        self.assertEqual(response.content, cached_content.encode())
 
     @patch("core.views.cache")
     @patch("core.views.cache_tag")
@@ -255,89 +397,9 @@ class ViewsTestCase(TestCase):
             b"Feed not found, Maybe it's still in progress, Please try again later.",
         )
 
-    def test_import_opml_get_request(self):
-        """Test the import_opml view with GET request."""
-        request = self.factory.get("/fake-url")
-        response = import_opml(request)
-
-        self.assertEqual(response.status_code, 302)
-        self.assertEqual(response.url, reverse("admin:core_feed_changelist"))
-
-    def test_import_opml_no_file_uploaded(self):
-        """Test the import_opml view when no file is uploaded."""
-        request = self.factory.post("/fake-url", {})
-        messages = self._setup_request_with_messages(request)
-
-        response = import_opml(request)
-
-        self.assertEqual(response.status_code, 302)
-        self.assertIn("Please upload a valid OPML file.", [str(m) for m in messages])
-
-    def test_import_opml_invalid_file_type(self):
-        """Test the import_opml view with invalid file type."""
-        # Create a mock file that's not InMemoryUploadedFile
-        mock_file = MagicMock()
-        mock_file.name = "test.txt"
-
-        request = self.factory.post("/fake-url", {"opml_file": mock_file})
-        messages = self._setup_request_with_messages(request)
-
-        response = import_opml(request)
-
-        self.assertEqual(response.status_code, 302)
-        # The mock file will cause XML parsing error, so we check for that instead
-        self.assertTrue(any("XML syntax error:" in str(m) for m in messages))
-
-    def test_import_opml_xml_syntax_error(self):
-        """Test the import_opml view with XML syntax error."""
-        invalid_xml = "<opml version='2.0'><body><outline>"
-        opml_file = self._create_opml_file(invalid_xml, "invalid.opml")
-        request = self.factory.post("/fake-url", {"opml_file": opml_file})
-        messages = self._setup_request_with_messages(request)
-
-        initial_feed_count = Feed.objects.count()
-        import_opml(request)
-
-        self.assertEqual(Feed.objects.count(), initial_feed_count)
-        self.assertTrue(any("XML syntax error:" in str(m) for m in messages))
-
-    def test_import_opml_general_exception(self):
-        """Test the import_opml view with general exception."""
-        opml_content = """
-        <opml version="2.0">
-            <body>
-                <outline text="Feed 1" title="Feed 1" type="rss" xmlUrl="http://example.com/feed1.xml" />
-            </body>
-        </opml>
-        """
-        opml_file = self._create_opml_file(opml_content, "feeds.opml")
-        request = self.factory.post("/fake-url", {"opml_file": opml_file})
-        messages = self._setup_request_with_messages(request)
-
-        # Mock Feed.objects.get_or_create to raise an exception
-        with patch("core.views.Feed.objects.get_or_create") as mock_get_or_create:
-            mock_get_or_create.side_effect = Exception("Database error")
-
-            initial_feed_count = Feed.objects.count()
-            import_opml(request)
-
-            self.assertEqual(Feed.objects.count(), initial_feed_count)
-            self.assertTrue(
-                any("Error importing OPML file:" in str(m) for m in messages)
-            )
-
     def test_import_opml_with_tags(self):
         """Test importing an OPML file with tags."""
-        opml_content = """
-        <opml version="2.0">
-            <body>
-                <outline text="Technology">
-                    <outline text="Tech Blog" title="Tech Blog" type="rss" xmlUrl="http://example.com/tech.xml" />
-                </outline>
-            </body>
-        </opml>
-        """
-        opml_file = self._create_opml_file(opml_content, "with_tags.opml")
+        opml_file = self._make_upload(self._OPML_TAGGED_BYTES, "with_tags.opml")
         request = self.factory.post("/fake-url", {"opml_file": opml_file})
         self._setup_request_with_messages(request)
 
@@ -349,6 +411,35 @@ class ViewsTestCase(TestCase):
         self.assertEqual(Feed.objects.count(), initial_feed_count + 1)
         self.assertEqual(Tag.objects.count(), initial_tag_count + 1)
 
-        new_feed = Feed.objects.get(feed_url="http://example.com/tech.xml")
-        new_tag = Tag.objects.get(name="Technology")
-        self.assertTrue(new_feed.tags.filter(name="Technology").exists())
+        self.assertTrue(
+            Feed.objects.filter(
+                feed_url="http://example.com/tech.xml", tags__name="Technology"
+            ).exists()
+        )
+
+    def test_import_opml_query_count_is_independent_of_feed_count(self):
+        """Importing many outlines batches the Feed, Tag and M2M writes."""
+        # bulk_create splits its INSERT by the backend's parameter limit, so
+        # compare one outline against as many as fit in a single batch.
+        many = min(
+            200,
+            connection.ops.bulk_batch_size(Feed._meta.concrete_fields, []),
+        )
+        query_counts = []
+        for tag_name, count in ((b"One", 1), (b"Many", many)):
+            opml_file = self._make_upload(
+                self._bulk_opml_bytes(tag_name, count), "bulk.opml"
+            )
+            request = self.factory.post("/fake-url", {"opml_file": opml_file})
+            self._setup_request_with_messages(request)
+            with CaptureQueriesContext(connection) as ctx:
+                import_opml(request)
+            query_counts.append(len(ctx.captured_queries))
+
+        self.assertEqual(query_counts[0], query_counts[1])
+        self.assertEqual(Tag.objects.get(name="Many").feeds.count(), many)
+        self.assertTrue(
+            Feed.objects.filter(
+                feed_url="http://example.com/Many/%d.xml" % (many - 1)
+            ).exists()
+        )
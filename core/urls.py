@@ -1,74 +1,54 @@
-from django.urls import path
+from django.urls import path, re_path
 
 from . import views
 
 app_name = "core"
+# "/?$" 同时匹配带或不带结尾斜杠的地址，无需成对的重复路由
 urlpatterns = [
     # path("filter/<str:name>", views.filter, name="filter"),
-    path(
-        "tag/proxy/<str:tag>",
-        views.tag,
-        kwargs={"feed_type": "o", "format": "xml"},
-    ),
-    path(
-        "tag/proxy/<str:tag>/",
+    re_path(
+        r"^tag/proxy/(?P<tag>[^/]+)/?$",
         views.tag,
         kwargs={"feed_type": "o", "format": "xml"},
     ),
-    path(
-        "tag/json/<str:tag>",
-        views.tag,
-        kwargs={"feed_type": "t", "format": "json"},
-    ),
-    path(
-        "tag/json/<str:tag>/",
+    re_path(
+        r"^tag/json/(?P<tag>[^/]+)/?$",
         views.tag,
         kwargs={"feed_type": "t", "format": "json"},
     ),
-    path(
-        "tag/<str:tag>",
-        views.tag,
-        kwargs={"feed_type": "t", "format": "xml"},
-    ),
-    path(
-        "tag/<str:tag>/",
+    re_path(
+        r"^tag/(?P<tag>[^/]+)/?$",
         views.tag,
         kwargs={"feed_type": "t", "format": "xml"},
     ),
-    path(
-        "proxy/<str:feed_slug>", views.rss, kwargs={"feed_type": "o", "format": "xml"}
-    ),
-    path(
-        "proxy/<str:feed_slug>/", views.rss, kwargs={"feed_type": "o", "format": "xml"}
-    ),
-    path(
-        "json/<str:feed_slug>", views.rss, kwargs={"feed_type": "t", "format": "json"}
+    re_path(
+        r"^proxy/(?P<feed_slug>[^/]+)/?$",
+        views.rss,
+        kwargs={"feed_type": "o", "format": "xml"},
     ),
-    path(
-        "json/<str:feed_slug>/", views.rss, kwargs={"feed_type": "t", "format": "json"}
+    re_path(
+        r"^json/(?P<feed_slug>[^/]+)/?$",
+        views.rss,
+        kwargs={"feed_type": "t", "format": "json"},
     ),
     path("import_opml/", views.import_opml, name="import_opml"),
-    # Digest URLs
-    path("digest/view/<str:slug>", views.digest_view, name="digest_view"),
+    # Digest URLs：带斜杠的命名路由用于 reverse()，不带斜杠的为匿名别名
     path("digest/view/<str:slug>/", views.digest_view, name="digest_view"),
-    path(
-        "digest/json/<str:slug>",
-        views.digest,
-        kwargs={"format": "json"},
-        name="digest_json",
-    ),
+    path("digest/view/<str:slug>", views.digest_view),
     path(
         "digest/json/<str:slug>/",
         views.digest,
         kwargs={"format": "json"},
         name="digest_json",
     ),
-    path(
-        "digest/<str:slug>", views.digest, kwargs={"format": "xml"}, name="digest_rss"
-    ),
+    path("digest/json/<str:slug>", views.digest, kwargs={"format": "json"}),
     path(
         "digest/<str:slug>/", views.digest, kwargs={"format": "xml"}, name="digest_rss"
     ),
-    path("<str:feed_slug>", views.rss, kwargs={"feed_type": "t", "format": "xml"}),
-    path("<str:feed_slug>/", views.rss, kwargs={"feed_type": "t", "format": "xml"}),
+    path("digest/<str:slug>", views.digest, kwargs={"format": "xml"}),
+    re_path(
+        r"^(?P<feed_slug>[^/]+)/?$",
+        views.rss,
+        kwargs={"feed_type": "t", "format": "xml"},
+    ),
 ]
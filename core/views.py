@@ -1,8 +1,8 @@
 import logging
-from django.http import HttpResponse, StreamingHttpResponse, JsonResponse
-from django.utils.encoding import smart_str
+from django.http import HttpResponse, JsonResponse
 from django.utils import timezone
 from django.core.cache import cache
+from django.db import transaction
 from django.views.decorators.http import condition
 from .models import Feed, Tag, Digest
 from django.shortcuts import redirect, get_object_or_404
@@ -10,20 +10,43 @@ from django.contrib import messages
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from lxml import etree
 from django.utils.translation import gettext_lazy as _
-from feed2json import feed2json
 import mistune
 
-from .cache import cache_rss, cache_tag, cache_digest
+from .cache import (
+    cache_digest,
+    cache_rss,
+    cache_tag,
+    digest_cache_key,
+    rss_cache_key,
+    tag_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _get_feed_meta(request, feed_slug):
+    """Return the feed's validator columns, queried once per request.
+
+    Both `@condition` callbacks read the same row, so it is memoized on the
+    request. Raises `Feed.DoesNotExist` like `Feed.objects.get`.
+    """
+    if not hasattr(request, "_feed_meta"):
+        request._feed_meta = (
+            Feed.objects.filter(slug=feed_slug)
+            .values("last_translate", "last_fetch", "etag")
+            .first()
+        )
+    if request._feed_meta is None:
+        raise Feed.DoesNotExist(feed_slug)
+    return request._feed_meta
+
+
 def _get_modified(request, feed_slug, feed_type="t", **kwargs):
     try:
         if feed_type == "t":
-            modified = Feed.objects.get(slug=feed_slug).last_translate
+            modified = _get_feed_meta(request, feed_slug)["last_translate"]
         else:
-            modified = Feed.objects.get(slug=feed_slug).last_fetch
+            modified = _get_feed_meta(request, feed_slug)["last_fetch"]
     except Feed.DoesNotExist:
         logger.warning(
             "Translated feed not found, Maybe still in progress, Please confirm it's exist: %s",
@@ -36,10 +59,10 @@ def _get_modified(request, feed_slug, feed_type="t", **kwargs):
 def _get_etag(request, feed_slug, feed_type="t", **kwargs):
     try:
         if feed_type == "t":
-            last_translate = Feed.objects.get(slug=feed_slug).last_translate
+            last_translate = _get_feed_meta(request, feed_slug)["last_translate"]
             etag = last_translate.isoformat() if last_translate else None
         else:
-            etag = Feed.objects.get(slug=feed_slug).etag
+            etag = _get_feed_meta(request, feed_slug)["etag"]
     except Feed.DoesNotExist:
         logger.warning(
             "Feed not fetched yet, Please update it first: %s",
@@ -49,25 +72,16 @@ def _get_etag(request, feed_slug, feed_type="t", **kwargs):
     return etag
 
 
-def _make_response(atom_feed, filename, format="xml"):
+def _make_response(content, filename, format="xml"):
     if format == "json":
-        # 如果需要返回 JSON 格式
-        if not atom_feed:
+        # 缓存中已是序列化好的 JSON Feed，直接返回
+        if not content:
             return JsonResponse({"error": "No feed data available"}, status=404)
-        feed_json = feed2json(atom_feed)
-        response = JsonResponse(feed_json)
+        response = HttpResponse(content, content_type="application/json")
     else:
-        # 使用生成器函数实现流式传输
-        def stream_content():
-            if not atom_feed:
-                yield b"<error>No feed data available</error>"
-                return
-            chunk_size = 4096  # 每次发送4KB
-            for i in range(0, len(atom_feed), chunk_size):
-                yield atom_feed[i : i + chunk_size]
-
-        response = StreamingHttpResponse(
-            stream_content(),  # 使用生成器
+        # 内容已完整在内存中，直接返回，无需分块流式传输
+        response = HttpResponse(
+            content or b"<error>No feed data available</error>",
             content_type="application/xml; charset=utf-8",
         )
         response["Content-Disposition"] = f"inline; filename={filename}.xml"
@@ -90,44 +104,107 @@ def _get_digest_etag(request, slug: str, **kwargs):
         return None
 
 
+class _OPMLTarget:
+    """lxml parser target collecting feed outlines as the OPML is parsed.
+
+    No tree is built: lxml calls `start`/`end` for each element and
+    `close` returns `(feed_names, feed_tags)`, or None without a <body>.
+    """
+
+    def __init__(self):
+        self.feed_names = {}  # xmlUrl -> 名称，首次出现为准
+        self.feed_tags = []  # (xmlUrl, 标签名)
+        self.categories = []  # 当前所在的分类 outline 栈
+        self.outlines = []  # 已打开的 outline 是否为 feed
+        self.depth = 0  # 根元素深度为 1
+        self.has_body = self.in_body = False
+
+    def start(self, tag, attrib):
+        self.depth += 1
+        if self.depth == 2 and tag == "body":
+            self.has_body = self.in_body = True
+        elif self.in_body and tag == "outline":
+            # 检查是否为 feed（有 xmlUrl 属性）
+            is_feed = "xmlUrl" in attrib
+            # feed outline 的子节点被忽略
+            if is_feed and not any(self.outlines):
+                feed_url = attrib["xmlUrl"]
+                self.feed_names.setdefault(
+                    feed_url, attrib.get("title") or attrib.get("text")
+                )
+                if self.categories and self.categories[-1]:
+                    self.feed_tags.append((feed_url, self.categories[-1]))
+            elif not is_feed:
+                # 嵌套结构（新类别）
+                self.categories.append(attrib.get("text") or attrib.get("title"))
+            self.outlines.append(is_feed)
+
+    def end(self, tag):
+        self.depth -= 1
+        if self.depth == 1 and tag == "body":
+            self.in_body = False
+        elif self.in_body and tag == "outline":
+            if not self.outlines.pop():
+                self.categories.pop()
+
+    def close(self):
+        return (self.feed_names, self.feed_tags) if self.has_body else None
+
+
+def _parse_opml(opml_file):
+    """Parse an OPML upload in 64 KB chunks into feed names and tag pairs."""
+    # 使用安全的 lxml 解析器，事件直接回调到 target，不构建 DOM
+    parser = etree.XMLParser(target=_OPMLTarget(), resolve_entities=False)
+    for chunk in opml_file.chunks(64 * 1024):
+        parser.feed(chunk)
+    return parser.close()
+
+
 def import_opml(request):
     if request.method == "POST":
         opml_file = request.FILES.get("opml_file")
         if opml_file and isinstance(opml_file, InMemoryUploadedFile):
             try:
-                # 直接读取字节数据（lxml 支持二进制解析）
-                opml_content = opml_file.read()
-
-                # 使用安全的 lxml 解析器解析 OPML
-                parser = etree.XMLParser(resolve_entities=False)
-                root = etree.fromstring(opml_content, parser=parser)
-                body = root.find("body")
-
-                if body is None:
+                parsed = _parse_opml(opml_file)
+                if parsed is None:
                     messages.error(request, _("Invalid OPML: Missing body element"))
                     return redirect("admin:core_feed_changelist")
-
-                # 递归处理所有 outline 节点
-                def process_outlines(outlines, tag: str = None):
-                    for outline in outlines:
-                        # 检查是否为 feed（有 xmlUrl 属性）
-                        if "xmlUrl" in outline.attrib:
-                            feed, created = Feed.objects.get_or_create(
-                                feed_url=outline.get("xmlUrl"),
-                                defaults={
-                                    "name": outline.get("title") or outline.get("text")
-                                },
-                            )
-                            if tag:
-                                tag_obj, _ = Tag.objects.get_or_create(name=tag)
-                                feed.tags.add(tag_obj)
-                        # 处理嵌套结构（新类别）
-                        elif outline.find("outline") is not None:
-                            new_tag = outline.get("text") or outline.get("title")
-                            process_outlines(outline.findall("outline"), new_tag)
-
-                # 从 body 开始处理顶级 outline
-                process_outlines(body.findall("outline"))
+                feed_names, feed_tags = parsed
+
+                # 所有写入在同一事务中完成，失败时整体回滚
+                with transaction.atomic():
+                    feeds = {}
+                    for feed in Feed.objects.filter(feed_url__in=feed_names):
+                        feeds.setdefault(feed.feed_url, feed)
+                    new_feeds = [
+                        Feed(feed_url=feed_url, name=name)
+                        for feed_url, name in feed_names.items()
+                        if feed_url not in feeds
+                    ]
+                    # bulk_create 不会调用 save()，需手动生成 slug 等字段
+                    for feed in new_feeds:
+                        feed.prepare_for_save()
+                    for feed in Feed.objects.bulk_create(new_feeds, batch_size=500):
+                        feeds[feed.feed_url] = feed
+
+                    if feed_tags:
+                        tags = {}
+                        tag_names = {tag_name for _url, tag_name in feed_tags}
+                        for tag_obj in Tag.objects.filter(name__in=tag_names):
+                            tags.setdefault(tag_obj.name, tag_obj)
+                        # 新标签逐个创建，以便 AutoSlugField 生成唯一 slug
+                        for tag_name in tag_names - tags.keys():
+                            tags[tag_name] = Tag.objects.create(name=tag_name)
+                        through = Feed.tags.through
+                        through.objects.bulk_create(
+                            [
+                                through(
+                                    feed_id=feeds[feed_url].pk, tag_id=tags[tag_name].pk
+                                )
+                                for feed_url, tag_name in feed_tags
+                            ],
+                            ignore_conflicts=True,
+                        )
 
                 messages.success(request, _("OPML file imported successfully."))
             except etree.XMLSyntaxError as e:
@@ -144,10 +221,9 @@ def import_opml(request):
 
 @condition(etag_func=_get_etag, last_modified_func=_get_modified)
 def rss(request, feed_slug, feed_type="t", format="xml"):
-    # Sanitize the feed_slug to prevent path traversal attacks
-    feed_slug = smart_str(feed_slug)
+    # feed_slug 来自 URL 中的 [^/]+，已是不含路径分隔符的 str，仅用于查询和缓存键
     try:
-        cache_key = f"cache_rss_{feed_slug}_{feed_type}_{format}"
+        cache_key = rss_cache_key(feed_slug, feed_type, format)
         content = cache.get(cache_key)
         if content is None:
             logger.debug(f"Cache MISS for key: {cache_key}")
@@ -165,14 +241,11 @@ def rss(request, feed_slug, feed_type="t", format="xml"):
 
 
 def tag(request, tag: str, feed_type="t", format="xml"):
-    tag = smart_str(tag)
-    all_tag = list(Tag.objects.values_list("slug", flat=True))
-
-    if tag not in all_tag:
+    if not Tag.objects.filter(slug=tag).exists():
         return HttpResponse(status=404)
 
     try:
-        cache_key = f"cache_tag_{tag}_{feed_type}_{format}"
+        cache_key = tag_cache_key(tag, feed_type, format)
         content = cache.get(cache_key)
         if content is None:
             logger.debug(f"Cache MISS for key: {cache_key}")
@@ -299,9 +372,8 @@ def digest_view(request, slug):
 @condition(etag_func=_get_digest_etag, last_modified_func=_get_digest_modified)
 def digest(request, slug, format="xml"):
     """Return digest as ATOM/JSON feed, with caching."""
-    slug = smart_str(slug)
     try:
-        cache_key = f"cache_digest_{slug}_{format}"
+        cache_key = digest_cache_key(slug, format)
         content = cache.get(cache_key)
         if content is None:
             logger.debug(f"Cache MISS for key: {cache_key}")